@@ -3,21 +3,88 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
+import sys
 import tempfile
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, List, Optional, Set
-
-from config_manager import AppConfig, ConfigLoadError, DEFAULT_PATTERN, build_regex
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from config_manager import (
+    AppConfig,
+    ConfigLoadError,
+    DEFAULT_PATTERN,
+    build_regex,
+    compile_regex,
+)
 from token_manager import TokenTracker
 
-REGION_PATTERN = re.compile(DEFAULT_PATTERN)
-
-
+# Anything the whitespace/backslash clean-up in normalize_name would change.
+_NEEDS_TIDY = re.compile(r"\\|\s(?=[.\]\)])|\s{2,}|^\s|\s$")
+
+
+@functools.lru_cache(maxsize=64)
+def _requires_open_paren(pattern: re.Pattern[str]) -> bool:
+    """Return True if every match of pattern has to contain a literal '('.
+
+    True for ``build_regex`` output (mandatory leading ``\\(`` and no
+    top-level alternation); anything else is assumed to match anywhere.
+    """
+    text = getattr(pattern, "pattern", "")
+    prefix = r"\s*\("
+    if not isinstance(text, str) or not text.startswith(prefix):
+        return False
+    if text[len(prefix):len(prefix) + 1] in ("?", "*", "{"):
+        return False
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in text[len(prefix):]:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth <= 0:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=16)
+def _pattern_for_tokens(tokens: Tuple[str, ...]) -> re.Pattern[str]:
+    """Return the compiled regex used for a token list."""
+    return compile_regex(build_regex(list(tokens)))
+
+
+REGION_PATTERN = compile_regex(DEFAULT_PATTERN)
+# Worker threads used to list directories when ``parallel_scan`` is enabled.
+SCAN_WORKERS = 8
+# Entries between calls to an ``iter_candidates`` progress callback.
+PROGRESS_INTERVAL = 1024
+
+
+@functools.cache
 def _is_case_insensitive_filesystem() -> bool:
     """Detect if the filesystem is case-insensitive (Windows, macOS)."""
+    # The platform default answers this for almost everyone; only probe the
+    # filesystem on anything else.
+    if sys.platform in ("win32", "darwin"):
+        return True
+    if sys.platform.startswith("linux"):
+        return False
     # Create a temp file and check if we can find it with different case
     with tempfile.NamedTemporaryFile(prefix='CasE_TeSt_', delete=False) as tmp:
         tmp_path = Path(tmp.name)
@@ -32,18 +99,84 @@ def _is_case_insensitive_filesystem() -> bool:
         tmp_path.unlink(missing_ok=True)
 
 
-# Cache the result since filesystem type doesn't change during execution
-_CASE_INSENSITIVE = _is_case_insensitive_filesystem()
+# Bounded like the other caches here; apply_candidates also clears it per run
+# so the GUI doesn't keep every path it has ever renamed.
+@functools.lru_cache(maxsize=8192)
+def _normalize_path_for_comparison(path: Path) -> str:
+    """Normalize path for collision detection on case-insensitive systems.
 
+    Candidate paths are already absolute (the scan root is resolved), so a
+    lexical ``normpath`` is enough and no filesystem calls are made.
+    """
+    normalized = os.path.normpath(path)
+    if _is_case_insensitive_filesystem():
+        return normalized.lower()
+    return normalized
 
-def _normalize_path_for_comparison(path: Path) -> str:
-    """Normalize path for collision detection on case-insensitive systems."""
-    if _CASE_INSENSITIVE:
-        return str(path.resolve()).lower()
-    return str(path.resolve())
+
+class _DirectoryListings:
+    """Answer "does this path exist?" from one ``scandir`` per directory.
+
+    Listings are read lazily and kept in sync with the renames performed
+    through ``renamed``, so collision checks don't need a ``stat`` per
+    candidate.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[str, Set[str]] = {}
+        self._fold_case = _is_case_insensitive_filesystem()
+
+    def _key(self, name: str) -> str:
+        return name.lower() if self._fold_case else name
+
+    def _listing(self, directory: str) -> Set[str]:
+        names = self._names.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as it:
+                    names = {self._key(entry.name) for entry in it}
+            except OSError:
+                names = set()
+            self._names[directory] = names
+        return names
+
+    def exists(self, path: Path) -> bool:
+        return self._key(path.name) in self._listing(str(path.parent))
+
+    def renamed(self, source: Path, target: Path) -> None:
+        """Record a rename that has been performed on disk."""
+        names = self._names.get(str(source.parent))
+        if names is not None:
+            names.discard(self._key(source.name))
+        names = self._names.get(str(target.parent))
+        if names is not None:
+            names.add(self._key(target.name))
+        # A renamed directory's own listing is now stored under another path
+        self._names.pop(str(source), None)
+        self._names.pop(str(target), None)
+
+
+class Status(str, Enum):
+    """Outcome of a rename, as stored on ``RenameCandidate.status``.
+
+    Members are strings, so they compare equal to (and print as) their values.
+    """
+
+    PENDING = "pending"
+    DONE = "done"
+    DRY_RUN = "done (dry run)"
+    ERROR = "error"
+    ERROR_EDITED = "error (edited)"
+
+    __str__ = str.__str__
+    __format__ = str.__format__
 
 
-@dataclass
+DONE_STATUSES = frozenset({Status.DONE, Status.DRY_RUN})
+ERROR_STATUSES = frozenset({Status.ERROR, Status.ERROR_EDITED})
+
+
+@dataclass(slots=True)
 class RenameCandidate:
     """Represents a file or directory rename that will be performed."""
 
@@ -51,39 +184,108 @@ class RenameCandidate:
     new_name: str
     new_path: Path
     item_type: str  # "file" or "directory"
-    status: str = "pending"  # pending, done, error, skipped
+    status: Status = Status.PENDING
     message: str = ""
     relative_path: str = ""
     original_relative_path: str = ""
+    # String forms of ``path``/``new_path``; filled in when not supplied
+    path_str: str = ""
+    new_path_str: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.path_str:
+            self.path_str = os.fspath(self.path)
+        if not self.new_path_str:
+            self.new_path_str = os.fspath(self.new_path)
 
     def to_dict(self) -> dict:
         return {
             "type": self.item_type,
-            "old": str(self.path),
-            "new": str(self.new_path),
+            "old": self.path_str,
+            "new": self.new_path_str,
             "status": self.status,
             "message": self.message,
         }
 
 
+# Whitespace before closing punctuation is dropped, any other run of two or
+# more whitespace characters collapses to a single space.
+_TIDY_PATTERN = re.compile(r"(\s+(?=[.\]\)]))|\s{2,}")
+
+
+def _tidy_replacement(match: re.Match[str]) -> str:
+    return "" if match.lastindex else " "
+
+
 def normalize_name(name: str, pattern: re.Pattern[str] = REGION_PATTERN) -> str:
     """Strip region markers and tidy whitespace."""
+    if "(" not in name and _requires_open_paren(pattern) and not _NEEDS_TIDY.search(name):
+        return name
+    return _normalize_cached(name, pattern)
+
+
+# ROM sets repeat the same names (and tag shapes) across many folders, so the
+# result is memoised. Compiled patterns hash by their source and flags, which
+# keeps entries for different token lists apart.
+@functools.lru_cache(maxsize=8192)
+def _normalize_cached(name: str, pattern: re.Pattern[str]) -> str:
     new = pattern.sub(" ", name)
-    new = re.sub(r"\s{2,}", " ", new)
-    new = re.sub(r"\s+([.\]\)])", r"\1", new)
+    new = _TIDY_PATTERN.sub(_tidy_replacement, new)
     new = new.replace("\\", "")
     return new.strip()
 
 
-def _iter_directories(root: Path) -> Iterable[Path]:
-    """Yield directories under root, including root, deepest first."""
-    dirs = set()
-    for dirpath, dirnames, _ in os.walk(root):
-        dir_path = Path(dirpath)
-        dirs.add(dir_path)
-        for d in dirnames:
-            dirs.add(dir_path / d)
-    return sorted(dirs, key=lambda p: len(p.parts), reverse=True)
+def _scan_directory(dirpath: str) -> Optional[Tuple[List[os.DirEntry], List[os.DirEntry]]]:
+    """List one directory, split into subdirectories and everything else."""
+    dir_entries: List[os.DirEntry] = []
+    file_entries: List[os.DirEntry] = []
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dir_entries.append(entry)
+                else:
+                    file_entries.append(entry)
+    except OSError:
+        return None
+    return dir_entries, file_entries
+
+
+def _walk_scandir(
+    root: str, executor: Optional[Executor] = None
+) -> Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]:
+    """Walk root top-down like ``os.walk``, yielding ``DirEntry`` lists.
+
+    Symlinked directories are listed but not descended into and unreadable
+    directories are skipped; the entries carry the type bits from readdir so
+    no extra ``stat`` is needed per entry. With an executor, subdirectories
+    are listed ahead of time on the pool but still yielded in walk order.
+    """
+
+    def schedule(dirpath: str) -> Callable[[], Optional[Tuple[List[os.DirEntry], List[os.DirEntry]]]]:
+        if executor is None:
+            return functools.partial(_scan_directory, dirpath)
+        return executor.submit(_scan_directory, dirpath).result
+
+    stack = [(root, schedule(root))]
+    while stack:
+        dirpath, pending = stack.pop()
+        listing = pending()
+        if listing is None:
+            continue
+        dir_entries, file_entries = listing
+        for entry in reversed(dir_entries):
+            if not entry.is_symlink():
+                stack.append((entry.path, schedule(entry.path)))
+        yield dirpath, dir_entries, file_entries
+
+
+def _path_depth(path: str) -> int:
+    return path.count(os.sep)
 
 
 def collect_candidates(
@@ -93,121 +295,164 @@ def collect_candidates(
     token_tracker: Optional["TokenTracker"] = None,
 ) -> List[RenameCandidate]:
     """Scan for files and directories whose names need adjustments."""
+    return list(iter_candidates(root, config=config, token_tracker=token_tracker))
+
+
+def iter_candidates(
+    root: Path | str,
+    *,
+    config: Optional[AppConfig] = None,
+    token_tracker: Optional["TokenTracker"] = None,
+    cancel: Optional[threading.Event] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Iterator[RenameCandidate]:
+    """Yield rename candidates as the scan discovers them.
+
+    File candidates are yielded during the walk with their final paths;
+    directory candidates follow once the walk is done, deepest first. The
+    order matches ``collect_candidates``.
+
+    Setting ``cancel`` stops the walk before the next directory is listed;
+    the iterator then ends without yielding the directory candidates.
+    ``progress`` is called with the number of entries scanned so far, roughly
+    every ``PROGRESS_INTERVAL`` entries.
+    """
     root_path = Path(root).expanduser().resolve()
     if not root_path.exists():
         raise FileNotFoundError(f"Path not found: {root}")
 
     config = config or AppConfig.load()
-    pattern_text = config.regex
     if config.tokens:
-        pattern_text = build_regex(config.tokens)
-    pattern = re.compile(pattern_text)
-    candidates: List[RenameCandidate] = []
+        pattern = _pattern_for_tokens(tuple(config.tokens))
+    else:
+        pattern = config.pattern
+    return _iter_collect(root_path, pattern, config, token_tracker, cancel, progress)
+
+
+def _iter_collect(
+    root_path: Path,
+    pattern: re.Pattern[str],
+    config: AppConfig,
+    token_tracker: Optional["TokenTracker"],
+    cancel: Optional[threading.Event],
+    progress: Optional[Callable[[int], None]],
+) -> Iterator[RenameCandidate]:
+    if not config.parallel_scan:
+        yield from _collect(
+            root_path, pattern, config, token_tracker, None, cancel, progress
+        )
+        return
+    executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+    try:
+        yield from _collect(
+            root_path, pattern, config, token_tracker, executor, cancel, progress
+        )
+    finally:
+        # Drop listings queued ahead of a walk that was cancelled or abandoned.
+        executor.shutdown(cancel_futures=True)
+
+
+def _collect(
+    root_path: Path,
+    pattern: re.Pattern[str],
+    config: AppConfig,
+    token_tracker: Optional["TokenTracker"],
+    executor: Optional[Executor],
+    cancel: Optional[threading.Event] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Iterator[RenameCandidate]:
+    # Paths are handled as plain strings while walking; Path objects are only
+    # built for the candidates that are yielded.
+    root = str(root_path)
+    prefix_len = len(os.path.join(root, ""))
+    rename_directories = config.rename_directories
+    dir_candidates: List[Tuple[str, RenameCandidate]] = []
+    # Final location of every directory seen so far. The walk is top-down, so
+    # a directory's parent is always mapped before the directory itself.
+    dir_map: dict[str, str] = {}
+    # Same shortcut as normalize_name, hoisted out of the loops: names with
+    # no "(" and nothing to tidy can't change when the pattern needs a "(".
+    skip_untagged = _requires_open_paren(pattern)
+    needs_tidy = _NEEDS_TIDY.search
+
+    def renamed(name: str) -> Optional[str]:
+        if skip_untagged and "(" not in name and not needs_tidy(name):
+            return None
+        new_name = _normalize_cached(name, pattern)
+        return new_name if new_name != name else None
+
+    def add_directory(directory: str, name: str, relative: str, rename: bool) -> None:
+        parent = os.path.dirname(directory)
+        new_name = renamed(name) if rename else None
+        target = os.path.join(dir_map.get(parent, parent), new_name or name)
+        dir_map[directory] = target
+        if new_name is not None:
+            cand = RenameCandidate(
+                path=Path(directory),
+                new_name=new_name,
+                new_path=Path(target),
+                item_type="directory",
+                original_relative_path=relative,
+                relative_path=relative,
+                path_str=directory,
+                new_path_str=target,
+            )
+            dir_candidates.append((directory, cand))
 
     if token_tracker:
-        token_tracker.observe(root_path.name, root_path)
+        token_tracker.observe(root_path.name, root)
+    add_directory(root, root_path.name, ".", config.rename_root)
 
-    # Files first (top-down walk)
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        dir_path = Path(dirpath)
-        if token_tracker:
-            for dirname in dirnames:
-                token_tracker.observe(dirname, dir_path / dirname)
-        for fname in filenames:
-            if token_tracker:
-                token_tracker.observe(fname, dir_path / fname)
-            new_name = normalize_name(fname, pattern)
-            if new_name != fname:
-                path = dir_path / fname
-                new_path = dir_path / new_name
-                relative = str(path.relative_to(root_path))
-                candidates.append(
-                    RenameCandidate(
-                        path=path,
-                        new_name=new_name,
-                        new_path=new_path,
-                        item_type="file",
-                        original_relative_path=relative,
-                        relative_path=relative,
-                    )
-                )
+    # Relative paths are taken by slicing off the (possibly renamed) root
+    root_target = dir_map[root]
+    root_prefix = os.path.join(root_target, "")
 
-    # Directories, deepest-first to avoid renaming parents before children
-    if config.rename_directories:
-        for directory in _iter_directories(root_path):
-            new_name = normalize_name(directory.name, pattern)
-            if not config.rename_root and directory == root_path:
-                continue
-            if new_name != directory.name:
-                new_path = directory.with_name(new_name)
-                relative = str(directory.relative_to(root_path))
-                candidates.append(
-                    RenameCandidate(
-                        path=directory,
-                        new_name=new_name,
-                        new_path=new_path,
-                        item_type="directory",
-                        original_relative_path=relative,
-                        relative_path=relative,
-                    )
-                )
-    else:
-        # Still consider root rename if explicitly allowed
-        if config.rename_root:
-            root_name = normalize_name(root_path.name, pattern)
-            if root_name != root_path.name:
-                parent = root_path.parent
-                candidates.append(
-                    RenameCandidate(
-                        path=root_path,
-                        new_name=root_name,
-                        new_path=parent / root_name,
-                        item_type="directory",
-                        original_relative_path=".",
-                        relative_path=".",
-                    )
-                )
-
-    # Build a complete directory map for ALL directories (not just renamed ones)
-    # This ensures files in non-renamed subdirectories get correct parent paths
-    dir_map: dict[Path, Path] = {root_path: root_path}
-    dir_candidates = [c for c in candidates if c.item_type == "directory"]
-
-    # First pass: map directories that are being renamed
-    for cand in sorted(dir_candidates, key=lambda c: len(c.path.parts)):
-        parent_new = dir_map.get(cand.path.parent, cand.path.parent)
-        cand.new_path = parent_new / cand.new_name
-        dir_map[cand.path] = cand.new_path
-
-    # Second pass: map ALL directories (including non-renamed ones)
-    # by walking the tree and applying parent transformations
-    all_dirs = set()
-    for dirpath, dirnames, _ in os.walk(root_path):
-        all_dirs.add(Path(dirpath))
-        for dirname in dirnames:
-            all_dirs.add(Path(dirpath) / dirname)
-
-    for directory in sorted(all_dirs, key=lambda p: len(p.parts)):
-        if directory not in dir_map:
-            # This directory isn't being renamed, but its parent might be
-            parent_new = dir_map.get(directory.parent, directory.parent)
-            dir_map[directory] = parent_new / directory.name
-
-    root_target = dir_map.get(root_path, root_path)
+    def relative_to_root(target: str) -> str:
+        if target.startswith(root_prefix):
+            return target[len(root_prefix):]
+        return "." if target == root_target else target
 
-    for cand in candidates:
-        if cand.item_type == "file":
-            parent_new = dir_map.get(cand.path.parent, cand.path.parent)
-            cand.new_path = parent_new / cand.new_name
+    scanned = 0
+    next_report = PROGRESS_INTERVAL
 
-        target_path = cand.new_path
-        try:
-            rel = target_path.relative_to(root_target)
-            cand.relative_path = str(rel) if rel != Path(".") else "."
-        except ValueError:
-            cand.relative_path = str(target_path)
+    # Files first (top-down walk)
+    for dirpath, dir_entries, file_entries in _walk_scandir(root, executor):
+        if cancel is not None and cancel.is_set():
+            return
+        if progress is not None:
+            scanned += len(dir_entries) + len(file_entries)
+            if scanned >= next_report:
+                progress(scanned)
+                next_report = scanned + PROGRESS_INTERVAL
+        for entry in dir_entries:
+            if token_tracker:
+                token_tracker.observe(entry.name, entry.path)
+            add_directory(entry.path, entry.name, entry.path[prefix_len:], rename_directories)
+        parent_target = dir_map[dirpath]
+        for entry in file_entries:
+            fname = entry.name
+            if token_tracker:
+                token_tracker.observe(fname, entry.path)
+            new_name = renamed(fname)
+            if new_name is None:
+                continue
+            target = os.path.join(parent_target, new_name)
+            yield RenameCandidate(
+                path=Path(entry.path),
+                new_name=new_name,
+                new_path=Path(target),
+                item_type="file",
+                original_relative_path=entry.path[prefix_len:],
+                relative_path=relative_to_root(target),
+                path_str=entry.path,
+                new_path_str=target,
+            )
 
-    return candidates
+    # Directories, deepest-first to avoid renaming parents before children
+    dir_candidates.sort(key=lambda pair: _path_depth(pair[0]), reverse=True)
+    for directory, cand in dir_candidates:
+        cand.relative_path = relative_to_root(dir_map[directory])
+        yield cand
 
 
 def apply_candidates(
@@ -215,8 +460,12 @@ def apply_candidates(
     *,
     config: AppConfig,
     dry_run: bool = False,
+    progress: Optional[Callable[[RenameCandidate], None]] = None,
 ) -> None:
-    """Attempt to rename every candidate in-place."""
+    """Attempt to rename every candidate in-place.
+
+    ``progress`` is called with each candidate once its status is final.
+    """
     stop_on_error = config.stop_on_error
     auto_resolve = config.auto_resolve_conflicts
 
@@ -234,9 +483,11 @@ def apply_candidates(
     # Track runtime directory renames (original -> current location)
     # This is updated as we perform each directory rename
     dir_renames: dict[Path, Path] = {}
+    listings = _DirectoryListings()
+    _normalize_path_for_comparison.cache_clear()
 
-    for cand in dirs + files:
-        if cand.status != "pending":
+    for cand in chain(dirs, files):
+        if cand.status != Status.PENDING:
             continue
         if cand.item_type == "file":
             # Directories are renamed first, so the file now lives beneath the
@@ -250,14 +501,15 @@ def apply_candidates(
             target_path = current_parent / cand.new_name
 
         # --- Collision detection and resolution ---
+        source_norm = _normalize_path_for_comparison(source_path)
         i = 1
         resolved_path = target_path
         while True:
             resolved_norm = _normalize_path_for_comparison(resolved_path)
             
             # Check for existing file on disk or a pending rename targeting the same path
-            is_disk_conflict = resolved_path.exists() and resolved_norm != _normalize_path_for_comparison(source_path)
-            is_pending_conflict = resolved_norm in occupied and resolved_norm != _normalize_path_for_comparison(source_path)
+            is_disk_conflict = listings.exists(resolved_path) and resolved_norm != source_norm
+            is_pending_conflict = resolved_norm in occupied and resolved_norm != source_norm
 
             if not is_disk_conflict and not is_pending_conflict:
                 if resolved_path != target_path:
@@ -265,7 +517,7 @@ def apply_candidates(
                 break  # No conflict, we can proceed
 
             if not auto_resolve:
-                cand.status = "error"
+                cand.status = Status.ERROR
                 if is_disk_conflict:
                     cand.message = f"Target already exists on disk: {resolved_path}"
                 else:
@@ -281,11 +533,13 @@ def apply_candidates(
             resolved_path = target_path.with_name(new_name)
             i += 1
             if i > 100:  # Safety break
-                cand.status = "error"
+                cand.status = Status.ERROR
                 cand.message = "Could not find a free filename after 100 attempts."
                 break
         
-        if cand.status == "error":
+        if cand.status == Status.ERROR:
+            if progress is not None:
+                progress(cand)
             if stop_on_error:
                 break
             continue
@@ -295,38 +549,53 @@ def apply_candidates(
 
         try:
             if dry_run:
-                cand.status = "done (dry run)"
+                cand.status = Status.DRY_RUN
                 occupied.add(new_path_norm)
                 target_map[new_path_norm] = target_path
                 if cand.item_type == "directory":
                     dir_renames[cand.path] = target_path
             else:
                 source_path.rename(target_path)
-                cand.status = "done"
+                listings.renamed(source_path, target_path)
+                cand.status = Status.DONE
                 occupied.add(new_path_norm)
                 target_map[new_path_norm] = target_path
                 if cand.item_type == "directory":
                     dir_renames[cand.path] = target_path
         except OSError as exc:
-            cand.status = "error"
+            cand.status = Status.ERROR
             cand.message = str(exc)
-        
-        if cand.status == "error" and stop_on_error:
+
+        if progress is not None:
+            progress(cand)
+        if cand.status == Status.ERROR and stop_on_error:
             break
 
 
 def summarize(candidates: Iterable[RenameCandidate]) -> dict:
-    """Return simple metrics about rename results."""
-    summary = {"total": 0, "files": 0, "directories": 0, "errors": 0, "completed": 0}
-    type_key = {"file": "files", "directory": "directories"}
+    """Return simple metrics about rename results.
+
+    ``error_details`` holds one "old -> new: message" line per failed rename.
+    """
+    total = directories = completed = 0
+    error_details: List[str] = []
     for cand in candidates:
-        summary["total"] += 1
-        summary[type_key.get(cand.item_type, "files")] += 1
-        if cand.status.startswith("done"):
-            summary["completed"] += 1
-        if cand.status == "error":
-            summary["errors"] += 1
-    return summary
+        total += 1
+        if cand.item_type == "directory":
+            directories += 1
+        status = cand.status
+        if status == Status.ERROR:
+            error_details.append(f"{cand.path_str} -> {cand.new_path_str}: {cand.message}")
+        elif status in DONE_STATUSES:
+            completed += 1
+    return {
+        "total": total,
+        "files": total - directories,
+        "directories": directories,
+        "errors": len(error_details),
+        "completed": completed,
+        "error_details": error_details,
+    }
 
 
 if __name__ == "__main__":
@@ -372,7 +641,7 @@ if __name__ == "__main__":
 
     print(f"Found {len(all_candidates)} rename candidates:")
     for cand in all_candidates:
-        print(f"[{cand.item_type}] {cand.path} -> {cand.new_path}")
+        print(f"[{cand.item_type}] {cand.path_str} -> {cand.new_path_str}")
 
     if args.apply:
         apply_candidates(
@@ -391,9 +660,7 @@ if __name__ == "__main__":
                 f"\nCompleted {summary['completed']} renames "
                 f"({summary['errors']} errors)."
             )
-        if summary["errors"]:
-            for cand in all_candidates:
-                if cand.status == "error":
-                    print(f" - Failed: {cand.path} -> {cand.new_path}: {cand.message}")
+        for detail in summary["error_details"]:
+            print(f" - Failed: {detail}")
     else:
         print("\nPreview mode only. Use --apply to execute changes.")
@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
+import csv
+import dataclasses
+import errno
+import functools
+import os
+import re
+import signal
 import sys
+import threading
+import time
+from itertools import compress
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
-
-from PySide6.QtCore import Qt, QPoint
-from PySide6.QtGui import QKeySequence, QShortcut
+from typing import Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRunnable,
+    QSignalBlocker,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QBrush, QColor, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QFileDialog,
     QHBoxLayout,
@@ -17,8 +40,7 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QCheckBox,
     QVBoxLayout,
@@ -32,16 +54,17 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QGroupBox,
     QInputDialog,
-    QScrollArea,
+    QTableWidget,
+    QTableWidgetItem,
 )
 
 from config_manager import (
     AppConfig,
     ConfigLoadError,
-    DEFAULT_PATTERN,
     DEFAULT_TOKENS,
     PRESETS_DIR,
     build_regex,
+    compile_regex,
     load_preset_tokens,
 )
 from token_manager import (
@@ -49,13 +72,49 @@ from token_manager import (
     TokenTracker,
     find_duplicate_tokens,
     normalize_token,
+    normalized_token_set,
     validate_tokens,
 )
-from cleanfilenames_core import apply_candidates, collect_candidates, summarize, RenameCandidate
+from cleanfilenames_core import (
+    apply_candidates,
+    collect_candidates,
+    iter_candidates,
+    summarize,
+    DONE_STATUSES,
+    ERROR_STATUSES,
+    RenameCandidate,
+    Status,
+)
+
+
+def _normalize_path_for_gui(path: str) -> str:
+    # Lexical only: candidates all come from one walk that never follows
+    # symlinked directories, so resolve() would just add syscalls per path.
+    return os.path.normpath(path).lower()
+
 
+def _rename_in_place(source: Path, new_name: str) -> None:
+    """Rename ``source`` to ``new_name`` in the same folder.
 
-def _normalize_path_for_gui(path: Path) -> str:
-    return str(path.resolve()).lower()
+    Raises ``FileExistsError`` rather than replacing an existing entry, and
+    ``FileNotFoundError`` when the source is gone.
+    """
+    target = source.parent / new_name
+    # rename() silently replaces an existing file on POSIX, so check first.
+    if target.exists():
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(target))
+    os.rename(source, target)
+
+
+def _display_fields(cand: RenameCandidate) -> Tuple[str, str, str, str, str]:
+    """Text shown for a candidate in the table, clipboard copies and CSV export."""
+    return (
+        cand.item_type,
+        cand.original_relative_path or cand.path_str,
+        cand.relative_path or cand.new_path_str,
+        cand.status,
+        cand.message,
+    )
 
 
 def get_presets() -> List[str]:
@@ -65,6 +124,273 @@ def get_presets() -> List[str]:
     return sorted([p.stem for p in PRESETS_DIR.glob("*.txt")])
 
 
+class WorkerSignals(QObject):
+    """Signals used by the background workers to report back to the GUI."""
+
+    chunk = Signal(list)
+    progress = Signal(int, int)
+    updated = Signal(object)
+    finished = Signal(object)
+    error = Signal(object)
+
+
+class ScanWorker(QRunnable):
+    """Collect rename candidates on a thread-pool thread.
+
+    Candidates are emitted in ``chunk`` batches as they are found and
+    ``progress`` reports (entries scanned, candidates found); ``finished``
+    carries the total count once the scan is complete.
+    """
+
+    CHUNK_SIZE = 256
+    CHUNK_INTERVAL = 0.05  # seconds
+    PROGRESS_INTERVAL = 0.2  # seconds
+
+    def __init__(
+        self,
+        path: str,
+        config: AppConfig,
+        token_tracker: Optional[TokenTracker],
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.config = config
+        self.token_tracker = token_tracker
+        self.cancel = threading.Event()
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        count = 0
+        buffer: List[RenameCandidate] = []
+        last_flush = last_progress = time.monotonic()
+
+        def report(scanned: int) -> None:
+            nonlocal last_progress
+            now = time.monotonic()
+            if now - last_progress >= self.PROGRESS_INTERVAL:
+                self.signals.progress.emit(scanned, count)
+                last_progress = now
+
+        try:
+            for cand in iter_candidates(
+                self.path,
+                config=self.config,
+                token_tracker=self.token_tracker,
+                cancel=self.cancel,
+                progress=report,
+            ):
+                buffer.append(cand)
+                count += 1
+                now = time.monotonic()
+                if len(buffer) >= self.CHUNK_SIZE or now - last_flush > self.CHUNK_INTERVAL:
+                    self.signals.chunk.emit(buffer)
+                    buffer = []
+                    last_flush = now
+            if buffer:
+                self.signals.chunk.emit(buffer)
+        except Exception as exc:  # reported to the GUI thread
+            self.signals.error.emit(exc)
+        else:
+            self.signals.finished.emit(count)
+
+
+class ApplyWorker(QRunnable):
+    """Re-collect candidates and apply (or simulate) the renames.
+
+    The fresh candidate list is sent as one ``chunk`` before renaming starts,
+    then ``updated`` carries each candidate as its status is settled.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        config: AppConfig,
+        token_tracker: Optional[TokenTracker],
+        dry_run: bool,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.config = config
+        self.token_tracker = token_tracker
+        self.dry_run = dry_run
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            candidates = collect_candidates(
+                self.path, config=self.config, token_tracker=self.token_tracker
+            )
+            self.signals.chunk.emit(candidates)
+            if candidates:
+                apply_candidates(
+                    candidates,
+                    config=self.config,
+                    dry_run=self.dry_run,
+                    progress=self.signals.updated.emit,
+                )
+        except Exception as exc:  # reported to the GUI thread
+            self.signals.error.emit(exc)
+        else:
+            self.signals.finished.emit(candidates)
+
+
+# Shared status colours; the view asks for them on every repaint.
+_ERROR_BRUSH = QBrush(QColor(Qt.red))
+_DONE_BRUSH = QBrush(QColor(Qt.darkGreen))
+_STATUS_BRUSH = {
+    Status.ERROR: _ERROR_BRUSH,
+    Status.ERROR_EDITED: QBrush(QColor(Qt.darkRed)),
+    Status.DONE: _DONE_BRUSH,
+    Status.DRY_RUN: _DONE_BRUSH,
+}
+
+# The view asks data() for about eight roles per cell on every paint; keep the
+# role values in plain names so rejecting the unused ones is a cheap compare.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+
+# Result filters and sort keys, applied with map() so update_table runs no
+# Python code per candidate.
+_STATUS_FILTERS = {"success": DONE_STATUSES, "error": ERROR_STATUSES}
+_SORT_KEYS = {
+    "type": attrgetter("item_type"),
+    "status": attrgetter("status"),
+    "message": lambda cand: cand.message or "",
+}
+
+
+class CandidatesModel(QAbstractTableModel):
+    """Table model showing one page of rename candidates.
+
+    Rows are indices into the shared candidate list, so cells are formatted
+    only when the view asks for them.
+    """
+
+    HEADERS = ("Type", "Original (rel)", "New (rel)", "Status", "Message")
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._candidates: List[RenameCandidate] = []
+        self._rows: List[int] = []
+        # id(candidate) -> table row, for refreshing single rows
+        self._row_of: dict[int, int] = {}
+
+    def set_rows(self, candidates: List[RenameCandidate], rows: List[int]) -> None:
+        """Show ``candidates[i]`` for each ``i`` in ``rows``."""
+        self.beginResetModel()
+        self._candidates = candidates
+        self._rows = list(rows)
+        self._row_of = {id(candidates[i]): row for row, i in enumerate(self._rows)}
+        self.endResetModel()
+
+    def replace_rows(self, rows: List[int]) -> None:
+        """Show other candidates from the same list, reusing the existing rows.
+
+        Only the row-count difference is inserted or removed; the rest is
+        repainted with one ``dataChanged``, so the view keeps its state.
+        """
+        rows = list(rows)
+        old_count, new_count = len(self._rows), len(rows)
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._rows[new_count:]
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows.extend(rows[old_count:])
+            self.endInsertRows()
+        self._rows = rows
+        self._row_of = {id(self._candidates[i]): row for row, i in enumerate(rows)}
+        if new_count:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(new_count - 1, len(self.HEADERS) - 1)
+            )
+
+    def append_rows(self, rows: List[int]) -> None:
+        """Add candidate indices to the bottom of the table."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        for row, i in enumerate(rows, first):
+            self._row_of[id(self._candidates[i])] = row
+        self.endInsertRows()
+
+    def refresh(self, cand: RenameCandidate) -> None:
+        """Repaint the status and message of ``cand`` if it is on this page."""
+        row = self._row_of.get(id(cand))
+        if row is None:
+            return
+        self.dataChanged.emit(
+            self.index(row, 3), self.index(row, 4), [_DISPLAY_ROLE, _FOREGROUND_ROLE]
+        )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            if not index.isValid():
+                return None
+            return _display_fields(self._candidates[self._rows[index.row()]])[index.column()]
+        if role == _FOREGROUND_ROLE and index.column() == 3:
+            return _STATUS_BRUSH.get(self._candidates[self._rows[index.row()]].status)
+        return None
+
+
+class SuggestionsModel(QAbstractTableModel):
+    """Table model over the token suggestions found by the last scan."""
+
+    HEADERS = ("Token", "Count", "Sample")
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: List[Tuple[str, str, str]] = []
+
+    def set_suggestions(self, suggestions: List[TokenSuggestion]) -> None:
+        # Cell text is formatted here once, not on every repaint.
+        self.beginResetModel()
+        self._rows = [
+            (
+                suggestion.token,
+                str(suggestion.count),
+                suggestion.samples[0] if suggestion.samples else "",
+            )
+            for suggestion in suggestions
+        ]
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            if not index.isValid():
+                return None
+            return self._rows[index.row()][index.column()]
+        if role == _ALIGNMENT_ROLE and index.column() == 1:
+            return Qt.AlignCenter
+        return None
+
+
 HELP_TEXT = """
 <h3>Tokens &amp; Regex</h3>
 <p>Each token represents an entire region string that appears inside parentheses.
@@ -103,6 +429,19 @@ class MainWindow(QMainWindow):
         self.row_index_map: List[int] = []
         self.token_tracker: Optional[TokenTracker] = None
         self.suggestions: List[TokenSuggestion] = []
+        self._scan_in_flight = False
+        self._apply_in_flight = False
+        self._scan_path: str | None = None
+        self._apply_dry_run = True
+        self._scan_worker: Optional[ScanWorker] = None
+        self._workers: set[QRunnable] = set()
+        self._message_box: Optional[QMessageBox] = None
+        # Filter/sort/page changes rebuild the page once per event-loop turn,
+        # however many of them fire together.
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update_table)
 
         container = QWidget()
         self.setCentralWidget(container)
@@ -118,9 +457,9 @@ class MainWindow(QMainWindow):
         path_layout.addWidget(QLabel("Folder:"))
         path_layout.addWidget(self.path_edit, stretch=1)
         path_layout.addWidget(browse_btn)
-        tokens_btn = QPushButton("Token Manager")
-        tokens_btn.clicked.connect(self.on_token_manager)
-        path_layout.addWidget(tokens_btn)
+        self.tokens_btn = QPushButton("Token Manager")
+        self.tokens_btn.clicked.connect(self.on_token_manager)
+        path_layout.addWidget(self.tokens_btn)
         main_layout.addLayout(path_layout)
 
         # Dry run + action buttons
@@ -152,16 +491,17 @@ class MainWindow(QMainWindow):
         suggestion_layout = QVBoxLayout(self.suggestion_group)
         self.suggestion_info = QLabel("Run a scan to discover new tokens.")
         suggestion_layout.addWidget(self.suggestion_info)
-        self.suggestion_table = QTableWidget(0, 3)
-        self.suggestion_table.setHorizontalHeaderLabels(["Token", "Count", "Sample"])
+        self.suggestion_model = SuggestionsModel(self)
+        self.suggestion_table = QTableView()
+        self.suggestion_table.setModel(self.suggestion_model)
         suggestion_header = self.suggestion_table.horizontalHeader()
         suggestion_header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         suggestion_header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
         suggestion_header.setSectionResizeMode(2, QHeaderView.Stretch)
         self.suggestion_table.verticalHeader().setVisible(False)
         self.suggestion_table.setAlternatingRowColors(True)
-        self.suggestion_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.suggestion_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.suggestion_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.suggestion_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         suggestion_layout.addWidget(self.suggestion_table)
         suggestion_btns = QHBoxLayout()
         self.add_suggestions_btn = QPushButton("Add Selected to Tokens")
@@ -182,6 +522,12 @@ class MainWindow(QMainWindow):
         self.sort_ascending = True
         self.status_filter_mode = "all"
         self.filtered_indices: List[int] = []
+        self._counted_list: Optional[List[RenameCandidate]] = None
+        self._counted_len = 0
+        self._type_counts_cache = (0, 0)
+        self._targets_list: Optional[List[RenameCandidate]] = None
+        self._targets_len = 0
+        self._targets_by_norm: dict[str, List[RenameCandidate]] = {}
         controls_row = QHBoxLayout()
         controls_row.addWidget(QLabel("Filter results:"))
         self.filter_combo = QComboBox()
@@ -220,90 +566,215 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(pagination_controls)
 
         # Table of changes
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(
-            ["Type", "Original (rel)", "New (rel)", "Status", "Message"]
-        )
+        self.model = CandidatesModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        # Type/Status are fitted once per page in update_table rather than
+        # re-measured (ResizeToContents) whenever rows stream in.
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.Interactive)
+        header.resizeSection(0, 80)
+        header.resizeSection(3, 80)
         header.setSectionResizeMode(4, QHeaderView.Stretch)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table.verticalHeader().setVisible(False)
+        # Every row is one line of text, so give them all the same fixed height
+        # instead of having the view measure each row.
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.fontMetrics().height() + 6)
+        vertical_header.setVisible(False)
+        self.table.setWordWrap(False)
         self.table.setAlternatingRowColors(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_table_menu)
+        # Built once; a menu parented to the window would otherwise pile up
+        # with every right-click.
+        self.table_menu = QMenu(self)
+        self.table_menu.addAction("Copy Selected (Tab-separated)", self.copy_selected_rows)
+        self.table_menu.addAction("Export to CSV…", self.export_csv)
+        self.edit_target_action = self.table_menu.addAction(
+            "Edit Target Name…", self.edit_selected_target
+        )
+        self.resolve_conflict_action = self.table_menu.addAction(
+            "Resolve Multi-Conflicts…", lambda: resolve_conflict(self)
+        )
         QShortcut(QKeySequence.Copy, self.table, activated=self.copy_selected_rows)
         main_layout.addWidget(self.table, stretch=1)
 
     # slots
     def on_browse(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Select Folder")
+        # Skip symlink resolution and per-entry icon lookups; both stat every
+        # entry, which is slow on network shares.
+        options = (
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.DontUseCustomDirectoryIcons
+            | QFileDialog.Option.ReadOnly
+        )
+        directory = QFileDialog.getExistingDirectory(
+            self, "Select Folder", self.path_edit.text().strip(), options
+        )
         if directory:
             self.path_edit.setText(directory)
 
     def on_scan(self) -> None:
+        if self._apply_in_flight:
+            return
         path_text = self.path_edit.text().strip()
         if not path_text:
-            QMessageBox.warning(self, "Missing folder", "Please select a folder first.")
+            self._show_message(
+                QMessageBox.Warning,
+                "Missing folder",
+                "Please select a folder first.",
+            )
             return
+        # A new scan replaces one that is still running.
+        self._cancel_scan()
 
-        target_path = Path(path_text)
-        try:
-            tracker_tokens = (
-                self.config.tokens if self.config.tokens is not None else DEFAULT_TOKENS
-            )
-            self.token_tracker = TokenTracker(tracker_tokens)
-            self.candidates = collect_candidates(
-                target_path, config=self.config, token_tracker=self.token_tracker
-            )
-            self.current_page = 0
-            self.sort_field = "default"
-            self.sort_combo.setCurrentText("Default")
-            self.sort_order_btn.setEnabled(False)
-            self.sort_ascending = True
-            self.sort_order_btn.setText("Asc")
-            self.status_filter_mode = "all"
-            self.filter_combo.setCurrentText("All")
-            self.current_path = target_path
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
+        if not os.path.isdir(os.path.expanduser(path_text)):
+            self._show_message(
+                QMessageBox.Critical,
                 "Folder not found",
-                f"The path '{path_text}' does not exist.",
+                f"The path '{path_text}' does not exist or is not a folder.",
             )
-            self.candidates = []
-            self.current_page = 0
-            self.update_table()
-            self.token_tracker = None
-            self.clear_suggestions()
+            self._reset_results()
+            return
+
+        tracker_tokens = (
+            self.config.tokens if self.config.tokens is not None else DEFAULT_TOKENS
+        )
+        self.token_tracker = TokenTracker(tracker_tokens)
+        self._scan_path = path_text
+        # Results stream into a fresh, unsorted and unfiltered first page.
+        self.candidates = []
+        self.current_page = 0
+        self.sort_field = "default"
+        self.sort_combo.setCurrentText("Default")
+        self.sort_order_btn.setEnabled(False)
+        self.sort_ascending = True
+        self.sort_order_btn.setText("Asc")
+        self.status_filter_mode = "all"
+        self.filter_combo.setCurrentText("All")
+        self._update_timer.stop()
+        self.row_index_map = []
+        self.model.set_rows(self.candidates, self.row_index_map)
+
+        # Like apply, the scan reads its own copy of the settings.
+        worker = ScanWorker(
+            self._scan_path, dataclasses.replace(self.config), self.token_tracker
+        )
+        worker.signals.chunk.connect(
+            functools.partial(self._on_candidates_found, worker), Qt.QueuedConnection
+        )
+        worker.signals.progress.connect(
+            functools.partial(self._on_scan_progress, worker), Qt.QueuedConnection
+        )
+        worker.signals.finished.connect(
+            functools.partial(self._on_scan_done, worker), Qt.QueuedConnection
+        )
+        worker.signals.error.connect(
+            functools.partial(self._on_scan_failed, worker), Qt.QueuedConnection
+        )
+        self._scan_worker = worker
+        self._scan_in_flight = True
+        self._set_busy(True)
+        # Scanning again cancels this scan and starts over.
+        self.scan_btn.setEnabled(True)
+        self.summary_label.setText(f"Scanning '{path_text}'…")
+        self._start_worker(worker)
+
+    def _cancel_scan(self) -> None:
+        """Stop the running scan, if any; signals it still sends are ignored."""
+        if self._scan_worker is None:
+            return
+        self._scan_worker.cancel.set()
+        self._scan_worker = None
+        self._scan_in_flight = False
+        self._set_busy(False)
+
+    def _on_candidates_found(self, worker: ScanWorker, chunk: List[RenameCandidate]) -> None:
+        if worker is not self._scan_worker:
+            return
+        first = len(self.candidates)
+        self.candidates.extend(chunk)
+        # Only the default view can be extended in place; anything else is
+        # rebuilt by update_table once the scan finishes.
+        if (
+            self.current_page == 0
+            and self.sort_field == "default"
+            and self.status_filter_mode == "all"
+        ):
+            room = self.page_size - len(self.row_index_map)
+            self.append_rows(range(first, first + min(room, len(chunk))))
+
+    def _on_scan_progress(self, worker: ScanWorker, scanned: int, found: int) -> None:
+        if worker is not self._scan_worker:
+            return
+        self.summary_label.setText(f"Scanning… {scanned} scanned, {found} candidates")
+
+    def _on_scan_done(self, worker: ScanWorker, _count: int) -> None:
+        self._workers.discard(worker)
+        if worker is not self._scan_worker:
             return
+        self._scan_worker = None
+        self._scan_in_flight = False
+        self._set_busy(False)
+        self.current_path = Path(self._scan_path)
 
+        # update_table sets the summary line and the run button for both the
+        # empty and non-empty cases.
         if not self.candidates:
-            self.summary_label.setText("No changes needed.")
-            self.run_btn.setEnabled(False)
             self.current_page = 0
             self.update_table()
             self.suggestions = self.token_tracker.suggestions() if self.token_tracker else []
             self.update_suggestions_view()
             return
 
-        summary = summarize(self.candidates)
-        self.summary_label.setText(
-            f"Found {summary['total']} candidates "
-            f"({summary['files']} files, {summary['directories']} directories)."
-        )
-        self.run_btn.setEnabled(True)
         self.update_table()
         self.suggestions = self.token_tracker.suggestions()
         self.update_suggestions_view()
 
+    def _on_scan_failed(self, worker: ScanWorker, exc: Exception) -> None:
+        self._workers.discard(worker)
+        if worker is not self._scan_worker:
+            return
+        self._scan_worker = None
+        self._scan_in_flight = False
+        self._set_busy(False)
+        if isinstance(exc, FileNotFoundError):
+            self._show_message(
+                QMessageBox.Critical,
+                "Folder not found",
+                f"The path '{self._scan_path}' does not exist.",
+            )
+        else:
+            self._show_message(
+                QMessageBox.Critical,
+                "Scan failed",
+                f"Failed to scan folder:\n\n{exc}",
+            )
+        self._reset_results()
+
+    def _reset_results(self) -> None:
+        self.candidates = []
+        self.current_page = 0
+        self.update_table()
+        self.token_tracker = None
+        self.clear_suggestions()
+
     def on_apply(self) -> None:
+        if self._scan_in_flight or self._apply_in_flight:
+            return
         if not self.current_path:
-            QMessageBox.warning(self, "No folder scanned", "Please scan a folder first.")
+            self._show_message(
+                QMessageBox.Warning,
+                "No folder scanned",
+                "Please scan a folder first.",
+            )
             return
 
         confirm = QMessageBox.question(
@@ -315,36 +786,58 @@ class MainWindow(QMainWindow):
         if confirm != QMessageBox.Yes:
             return
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            self.candidates = collect_candidates(
-                self.current_path, config=self.config, token_tracker=self.token_tracker
-            )
-            if not self.candidates:
-                QMessageBox.information(self, "No changes", "No changes to apply.")
-                return
-
-            dry_run = self.dry_run_checkbox.isChecked()
-            apply_candidates(
-                self.candidates,
-                config=self.config,
-                dry_run=dry_run,
-            )
-            summary = summarize(self.candidates)
-        finally:
-            QApplication.restoreOverrideCursor()
+        self._apply_dry_run = self.dry_run_checkbox.isChecked()
+        # The worker gets its own copy, so settings changed mid-run can't
+        # reach a rename that is already under way.
+        worker = ApplyWorker(
+            self.current_path,
+            dataclasses.replace(self.config),
+            self.token_tracker,
+            self._apply_dry_run,
+        )
+        worker.signals.chunk.connect(self._on_apply_started, Qt.QueuedConnection)
+        worker.signals.updated.connect(self.model.refresh, Qt.QueuedConnection)
+        worker.signals.finished.connect(
+            functools.partial(self._on_apply_done, worker), Qt.QueuedConnection
+        )
+        worker.signals.error.connect(
+            functools.partial(self._on_apply_failed, worker), Qt.QueuedConnection
+        )
+        self._apply_in_flight = True
+        self._set_busy(True)
+        self._start_worker(worker)
 
+    def _on_apply_started(self, candidates: List[RenameCandidate]) -> None:
+        # Show the candidates being renamed so their rows update in place.
+        self.candidates = candidates
         self.update_table()
-        if dry_run:
+
+    def _on_apply_done(self, worker: ApplyWorker, candidates: List[RenameCandidate]) -> None:
+        self._workers.discard(worker)
+        self._apply_in_flight = False
+        self.candidates = candidates
+        self._set_busy(False)
+        if not self.candidates:
+            self._show_message(QMessageBox.Information, "No changes", "No changes to apply.")
+            return
+        summary = summarize(self.candidates)
+
+        # Rows were repainted in place as each rename finished; the page only
+        # needs rebuilding when the filter or sort order depends on status.
+        if self.status_filter_mode != "all" or self.sort_field in ("status", "message"):
+            self.update_table()
+        if self._apply_dry_run:
             message = (
                 f"Dry run complete: {summary['completed']} simulated renames "
                 f"({summary['errors']} would fail)."
             )
             if summary["errors"]:
                 message += "\n\nErrors are shown in the results table below."
-                QMessageBox.warning(self, "Dry run finished", message)
+                self._show_message(
+                    QMessageBox.Warning, "Dry run finished", message, summary["error_details"]
+                )
             else:
-                QMessageBox.information(self, "Dry run finished", message)
+                self._show_message(QMessageBox.Information, "Dry run finished", message)
             return
 
         message = (
@@ -353,9 +846,83 @@ class MainWindow(QMainWindow):
         )
         if summary["errors"]:
             message += "\n\nErrors are shown in the results table below."
-            QMessageBox.warning(self, "Finished with errors", message)
+            self._show_message(
+                QMessageBox.Warning, "Finished with errors", message, summary["error_details"]
+            )
         else:
-            QMessageBox.information(self, "Finished", message)
+            self._show_message(QMessageBox.Information, "Finished", message)
+
+    def _show_message(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        details: Iterable[str] = (),
+    ) -> None:
+        """Show a modal notice, reusing one QMessageBox for the window."""
+        box = self._message_box
+        if box is None or box.isVisible():
+            box = QMessageBox(self)
+            box.setStandardButtons(QMessageBox.Ok)
+            if self._message_box is None:
+                self._message_box = box
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setDetailedText("\n".join(details))
+        box.exec()
+
+    def _on_apply_failed(self, worker: ApplyWorker, exc: Exception) -> None:
+        self._workers.discard(worker)
+        self._apply_in_flight = False
+        self._set_busy(False)
+        self._show_message(
+            QMessageBox.Critical,
+            "Apply failed",
+            f"Failed to apply changes:\n\n{exc}",
+        )
+
+    def _start_worker(self, worker: QRunnable) -> None:
+        # Keep a reference so the worker's signals outlive QThreadPool's copy;
+        # the finished/error slots drop it again.
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def closeEvent(self, event) -> None:
+        # Renames can't be cancelled halfway, so keep the window (and the
+        # process) alive until the apply worker has finished.
+        if self._apply_in_flight:
+            event.ignore()
+            self._show_message(
+                QMessageBox.Information,
+                "Renaming in progress",
+                "Please wait for the current renames to finish before closing.",
+            )
+            return
+        self._cancel_scan()
+        super().closeEvent(event)
+
+    def _set_busy(self, busy: bool) -> None:
+        """Disable the scan/apply buttons and show a busy cursor while a worker runs.
+
+        Manual renames and settings changes are locked too, so they can't
+        race a worker that is reading the config or moving the same files.
+        """
+        self.scan_btn.setEnabled(not busy)
+        for control in (
+            self.tokens_btn,
+            self.auto_resolve_checkbox,
+            self.edit_target_action,
+            self.resolve_conflict_action,
+        ):
+            control.setEnabled(not busy)
+        self.add_suggestions_btn.setEnabled(not busy and bool(self.suggestions))
+        if busy:
+            self.run_btn.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+        else:
+            self.run_btn.setEnabled(bool(self.candidates))
+            QApplication.restoreOverrideCursor()
 
     def on_auto_resolve_toggled(self, checked: bool) -> None:
         """Update and save the auto-resolve setting."""
@@ -365,23 +932,21 @@ class MainWindow(QMainWindow):
         self.config.save()
         
     def on_token_manager(self) -> None:
+        if self._scan_in_flight or self._apply_in_flight:
+            return
         dialog = TokenManagerDialog(self.config, self)
         dialog.exec()
         if dialog.config_updated:
             self.config = AppConfig.load()
             self.token_tracker = None
-            QMessageBox.information(
-                self,
+            self._show_message(
+                QMessageBox.Information,
                 "Tokens updated",
                 "Token changes saved. Please rescan folders to update suggestions.",
             )
             if self.suggestions:
                 token_source = self.config.tokens if self.config.tokens is not None else DEFAULT_TOKENS
-                existing_norm = {
-                    normalize_token(token)
-                    for token in token_source
-                    if normalize_token(token)
-                }
+                existing_norm = normalized_token_set(token_source)
                 self.suggestions = [
                     suggestion
                     for suggestion in self.suggestions
@@ -389,107 +954,137 @@ class MainWindow(QMainWindow):
                 ]
         self.update_suggestions_view()
 
+    def schedule_update_table(self) -> None:
+        """Rebuild the page on the next event-loop turn."""
+        self._update_timer.start()
+
     def update_table(self) -> None:
+        self._update_timer.stop()
         base_total = len(self.candidates)
         if base_total == 0:
             self.filtered_indices = []
-            self.table.setUpdatesEnabled(False)
-            self.table.setRowCount(0)
-            self.table.setUpdatesEnabled(True)
+            self.row_index_map = []
+            self.model.set_rows(self.candidates, self.row_index_map)
             self.pagination_info.setText("No results to display.")
             self.prev_page_btn.setEnabled(False)
             self.next_page_btn.setEnabled(False)
             self.summary_label.setText("No changes to be made.")
             self.run_btn.setEnabled(False)
-            self.update_suggestions_view()
             return
 
         status_mode = self.status_filter_mode
-        filtered_pairs = []
-        for idx, cand in enumerate(self.candidates):
-            if status_mode == "success" and not cand.status.startswith("done"):
-                continue
-            if status_mode == "error" and not (
-                cand.status == "error" or cand.status == "error (edited)"
-            ):
-                continue
-            filtered_pairs.append((idx, cand))
-
-        if self.sort_field != "default":
-            reverse = not self.sort_ascending
-            if self.sort_field == "type":
-                filtered_pairs.sort(key=lambda pair: pair[1].item_type, reverse=reverse)
-            elif self.sort_field == "status":
-                filtered_pairs.sort(key=lambda pair: pair[1].status, reverse=reverse)
-            elif self.sort_field == "message":
-                filtered_pairs.sort(key=lambda pair: pair[1].message or "", reverse=reverse)
+        candidates = self.candidates
+        filtered = list(range(base_total))
+        wanted = _STATUS_FILTERS.get(status_mode)
+        if wanted is not None:
+            statuses = map(attrgetter("status"), candidates)
+            filtered = list(compress(filtered, map(wanted.__contains__, statuses)))
+
+        sort_key = _SORT_KEYS.get(self.sort_field)
+        if sort_key is not None:
+            keys = list(map(sort_key, map(candidates.__getitem__, filtered)))
+            order = sorted(
+                range(len(filtered)), key=keys.__getitem__, reverse=not self.sort_ascending
+            )
+            filtered = list(map(filtered.__getitem__, order))
 
-        self.filtered_indices = [idx for idx, _ in filtered_pairs]
-        total = len(filtered_pairs)
+        self.filtered_indices = filtered
+        total = len(filtered)
 
         if total == 0:
-            self.table.setUpdatesEnabled(False)
-            self.table.setRowCount(0)
-            self.table.setUpdatesEnabled(True)
+            self.row_index_map = []
+            self.model.set_rows(self.candidates, self.row_index_map)
             self.pagination_info.setText("No results match the current filter.")
             self.prev_page_btn.setEnabled(False)
             self.next_page_btn.setEnabled(False)
-            base_files = sum(1 for c in self.candidates if c.item_type == "file")
-            base_dirs = sum(1 for c in self.candidates if c.item_type == "directory")
+            base_files, base_dirs = self._type_counts()
             self.summary_label.setText(
                 f"Found {base_total} candidates ({base_files} files, {base_dirs} directories). "
                 "Filter matched 0 results."
             )
             self.run_btn.setEnabled(False)
-            self.update_suggestions_view()
             return
 
-        self.total_pages = max(1, (total + self.page_size - 1) // self.page_size)
-        if self.current_page >= self.total_pages:
-            self.current_page = self.total_pages - 1
-        start_index = self.current_page * self.page_size
-        end_index = min(start_index + self.page_size, total)
-        display_subset = filtered_pairs[start_index:end_index]
-        self.row_index_map = [idx for idx, _ in display_subset]
-
-        self.table.setUpdatesEnabled(False)
-        self.table.setRowCount(0)
-        for original_idx, cand in display_subset:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(cand.item_type))
-            orig_item = QTableWidgetItem(cand.original_relative_path or str(cand.path))
-            new_item = QTableWidgetItem(cand.relative_path or str(cand.new_path))
-            self.table.setItem(row, 1, orig_item)
-            self.table.setItem(row, 2, new_item)
-            status_item = QTableWidgetItem(cand.status)
-            if cand.status == "error":
-                status_item.setForeground(Qt.red)
-            elif cand.status == "error (edited)":
-                status_item.setForeground(Qt.darkRed)
-            elif cand.status.startswith("done"):
-                status_item.setForeground(Qt.darkGreen)
-            self.table.setItem(row, 3, status_item)
-            self.table.setItem(row, 4, QTableWidgetItem(cand.message))
-
-        self.table.setUpdatesEnabled(True)
-
-        file_count = sum(1 for c in self.candidates if c.item_type == "file")
-        dir_count = sum(1 for c in self.candidates if c.item_type == "directory")
+        self._show_page()
+
+        file_count, dir_count = self._type_counts()
         filter_note = ""
         if total != base_total or status_mode != "all":
             filter_note = f" Filtered view: {total} shown."
         self.summary_label.setText(
             f"Found {base_total} candidates ({file_count} files, {dir_count} directories).{filter_note}"
         )
+        # Re-sorting or paging mid-scan lands here too; Apply stays off until
+        # the worker that disabled it has finished.
+        self.run_btn.setEnabled(not (self._scan_in_flight or self._apply_in_flight))
+
+    def _type_counts(self) -> Tuple[int, int]:
+        """Return how many candidates are files and directories.
+
+        A candidate's type never changes and the list is only extended or
+        replaced, so the counts are kept until either happens.
+        """
+        candidates = self.candidates
+        if self._counted_list is not candidates or self._counted_len != len(candidates):
+            types = list(map(attrgetter("item_type"), candidates))
+            self._type_counts_cache = (types.count("file"), types.count("directory"))
+            self._counted_list, self._counted_len = candidates, len(candidates)
+        return self._type_counts_cache
+
+    def _candidates_by_target(self) -> dict[str, List[RenameCandidate]]:
+        """Group candidates by normalized target path, in list order.
+
+        Built on first use and kept, like the type counts, until the
+        candidate list is replaced or grows; target paths never change.
+        """
+        candidates = self.candidates
+        if self._targets_list is not candidates or self._targets_len != len(candidates):
+            groups: dict[str, List[RenameCandidate]] = {}
+            for cand in candidates:
+                groups.setdefault(_normalize_path_for_gui(cand.new_path_str), []).append(cand)
+            self._targets_by_norm = groups
+            self._targets_list, self._targets_len = candidates, len(candidates)
+        return self._targets_by_norm
+
+    def _show_page(self, reuse_rows: bool = False) -> None:
+        """Show the current page of ``filtered_indices`` and its pagination controls."""
+        total = len(self.filtered_indices)
+        self.total_pages = max(1, (total + self.page_size - 1) // self.page_size)
+        if self.current_page >= self.total_pages:
+            self.current_page = self.total_pages - 1
+        start_index = self.current_page * self.page_size
+        end_index = min(start_index + self.page_size, total)
+        self.row_index_map = self.filtered_indices[start_index:end_index]
+
+        if reuse_rows:
+            self.table.clearSelection()
+            self.model.replace_rows(self.row_index_map)
+            self.table.scrollToTop()
+        else:
+            self.model.set_rows(self.candidates, self.row_index_map)
+        self.table.resizeColumnToContents(0)
+        self.table.resizeColumnToContents(3)
+
         self.pagination_info.setText(
             f"Showing {start_index + 1}-{end_index} of {total} filtered "
             f"(Page {self.current_page + 1}/{self.total_pages})"
         )
         self.prev_page_btn.setEnabled(self.current_page > 0)
         self.next_page_btn.setEnabled(self.current_page < self.total_pages - 1)
-        self.run_btn.setEnabled(True)
-        self.update_suggestions_view()
+
+    def _change_page_view(self) -> None:
+        # Paging keeps the filter and sort order, so only the visible rows
+        # change. Mid-scan the filtered list is not built yet.
+        if self._scan_in_flight or self._update_timer.isActive() or not self.filtered_indices:
+            self.schedule_update_table()
+        else:
+            self._show_page(reuse_rows=True)
+
+    def append_rows(self, indices: Iterable[int]) -> None:
+        """Add candidates to the bottom of the results table."""
+        indices = list(indices)
+        self.row_index_map.extend(indices)
+        self.model.append_rows(indices)
 
     def change_page(self, delta: int) -> None:
         if not self.candidates:
@@ -499,14 +1094,14 @@ class MainWindow(QMainWindow):
         if new_page == self.current_page:
             return
         self.current_page = new_page
-        self.update_table()
+        self._change_page_view()
 
     def on_page_size_changed(self, value: int) -> None:
         if value <= 0:
             return
         self.page_size = value
         self.current_page = 0
-        self.update_table()
+        self._change_page_view()
 
     def on_filter_changed(self, text: str) -> None:
         mapping = {
@@ -516,7 +1111,7 @@ class MainWindow(QMainWindow):
         }
         self.status_filter_mode = mapping.get(text, "all")
         self.current_page = 0
-        self.update_table()
+        self.schedule_update_table()
 
     def on_sort_changed(self, text: str) -> None:
         mapping = {
@@ -528,91 +1123,82 @@ class MainWindow(QMainWindow):
         self.sort_field = mapping.get(text, "default")
         self.sort_order_btn.setEnabled(self.sort_field != "default")
         self.current_page = 0
-        self.update_table()
+        self.schedule_update_table()
 
     def toggle_sort_order(self) -> None:
         self.sort_ascending = not self.sort_ascending
         self.sort_order_btn.setText("Asc" if self.sort_ascending else "Desc")
         if self.sort_field != "default":
-            self.update_table()
+            self.schedule_update_table()
 
     def update_suggestions_view(self) -> None:
         if not self.suggestions:
             self.suggestion_group.setVisible(False)
-            self.suggestion_table.setRowCount(0)
+            self.suggestion_model.set_suggestions([])
             self.suggestion_info.setText("No new token suggestions.")
             self.add_suggestions_btn.setEnabled(False)
             self.clear_suggestions_btn.setEnabled(False)
             return
         self.suggestion_group.setVisible(True)
         self.suggestion_info.setText("Select tokens to add them to your configuration.")
-        self.suggestion_table.setRowCount(0)
-        for suggestion in self.suggestions:
-            row = self.suggestion_table.rowCount()
-            self.suggestion_table.insertRow(row)
-            token_item = QTableWidgetItem(suggestion.token)
-            count_item = QTableWidgetItem(str(suggestion.count))
-            count_item.setTextAlignment(Qt.AlignCenter)
-            sample_item = QTableWidgetItem(suggestion.samples[0] if suggestion.samples else "")
-            self.suggestion_table.setItem(row, 0, token_item)
-            self.suggestion_table.setItem(row, 1, count_item)
-            self.suggestion_table.setItem(row, 2, sample_item)
-        self.add_suggestions_btn.setEnabled(True)
+        self.suggestion_model.set_suggestions(self.suggestions)
+        self.add_suggestions_btn.setEnabled(not (self._scan_in_flight or self._apply_in_flight))
         self.clear_suggestions_btn.setEnabled(True)
 
     def clear_suggestions(self) -> None:
         self.suggestions = []
         self.suggestion_group.setVisible(False)
-        self.suggestion_table.setRowCount(0)
+        self.suggestion_model.set_suggestions([])
         self.suggestion_info.setText("No new token suggestions.")
         self.add_suggestions_btn.setEnabled(False)
         self.clear_suggestions_btn.setEnabled(False)
 
     def add_selected_suggestions(self) -> None:
-        if not self.suggestions:
+        if self._scan_in_flight or self._apply_in_flight or not self.suggestions:
             return
         selection = self.suggestion_table.selectionModel().selectedRows()
         if not selection:
-            QMessageBox.information(self, "Add Tokens", "Select at least one suggestion to add.")
+            self._show_message(
+                QMessageBox.Information,
+                "Add Tokens",
+                "Select at least one suggestion to add.",
+            )
             return
-        selected_indices = sorted({index.row() for index in selection})
-        new_tokens = [
-            self.suggestions[idx].token
-            for idx in selected_indices
-            if idx < len(self.suggestions)
-        ]
-        if not new_tokens:
+        selected_indices = sorted(
+            {index.row() for index in selection if index.row() < len(self.suggestions)}
+        )
+        if not selected_indices:
             return
+        # Normalized once per suggestion; reused for the add and the filter pass.
+        suggestion_norms = [normalize_token(suggestion.token) for suggestion in self.suggestions]
         tokens_source = self.config.tokens if self.config.tokens is not None else DEFAULT_TOKENS
         tokens = list(tokens_source)
-        existing_norm = {normalize_token(token) for token in tokens if normalize_token(token)}
-        added_tokens: List[str] = []
-        for token in new_tokens:
-            normalized = normalize_token(token)
+        existing_norm = normalized_token_set(tokens)
+        added_norm: set[str] = set()
+        for idx in selected_indices:
+            normalized = suggestion_norms[idx]
             if not normalized or normalized in existing_norm:
                 continue
-            tokens.append(token)
+            tokens.append(self.suggestions[idx].token)
             existing_norm.add(normalized)
-            added_tokens.append(token)
-        if not added_tokens:
-            QMessageBox.information(
-                self,
+            added_norm.add(normalized)
+        if not added_norm:
+            self._show_message(
+                QMessageBox.Information,
                 "Tokens already present",
                 "Selected suggestions already exist in your configuration.",
             )
             return
-        self.config.tokens = tokens
-        self.config.regex = build_regex(tokens)
+        self.config.set_tokens(tokens)
         self.config.save()
         self.config = AppConfig.load()
-        added_norm = {normalize_token(token) for token in added_tokens}
         self.suggestions = [
             suggestion
-            for suggestion in self.suggestions
-            if normalize_token(suggestion.token) not in added_norm
+            for suggestion, normalized in zip(self.suggestions, suggestion_norms)
+            if normalized not in added_norm
         ]
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Tokens added",
             "Selected suggestions were added to your configuration.",
         )
@@ -623,37 +1209,28 @@ class MainWindow(QMainWindow):
             self.token_tracker = TokenTracker(tracker_tokens)
         self.update_suggestions_view()
 
+    def _selected_rows(self) -> List[int]:
+        """Return the selected table rows in order.
+
+        Reads the selection ranges rather than ``selectedRows()``, which
+        builds one QModelIndex per row when everything is selected.
+        """
+        rows = set()
+        for selected in self.table.selectionModel().selection():
+            rows.update(range(selected.top(), selected.bottom() + 1))
+        return sorted(row for row in rows if row < len(self.row_index_map))
+
     def copy_selected_rows(self) -> None:
-        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        rows = self._selected_rows()
         if not rows:
             return
-        lines = []
-        for row in rows:
-            if row >= len(self.row_index_map):
-                continue
-            cand = self.candidates[self.row_index_map[row]]
-            lines.append(
-                f"{cand.item_type}\t{cand.original_relative_path or cand.path}\t"
-                f"{cand.relative_path or cand.new_path}\t{cand.status}\t{cand.message}"
-            )
-        if lines:
-            QApplication.clipboard().setText("\n".join(lines))
+        candidates, row_index_map = self.candidates, self.row_index_map
+        QApplication.clipboard().setText(
+            "\n".join("\t".join(_display_fields(candidates[row_index_map[row]])) for row in rows)
+        )
 
     def show_table_menu(self, pos: QPoint) -> None:
-        menu = QMenu(self)
-        copy_action = menu.addAction("Copy Selected (Tab-separated)")
-        export_action = menu.addAction("Export to CSV…")
-        edit_action = menu.addAction("Edit Target Name…")
-        resolve_action = menu.addAction("Resolve Multi-Conflicts…")
-        action = menu.exec(self.table.viewport().mapToGlobal(pos))
-        if action == copy_action:
-            self.copy_selected_rows()
-        elif action == export_action:
-            self.export_csv()
-        elif action == edit_action:
-            self.edit_selected_target()
-        elif action == resolve_action:
-            resolve_conflict(self)
+        self.table_menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def export_csv(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -664,38 +1241,32 @@ class MainWindow(QMainWindow):
         )
         if not path:
             return
-        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        rows = self._selected_rows()
         if rows:
-            candidate_indices = [
-                self.row_index_map[row]
-                for row in rows
-                if row < len(self.row_index_map)
-            ]
+            candidate_indices = [self.row_index_map[row] for row in rows]
         else:
-            candidate_indices = list(self.filtered_indices or range(len(self.candidates)))
-        lines = ["type,old,new,status,message"]
-        for idx in candidate_indices:
-            cand = self.candidates[idx]
-            fields = [
-                cand.item_type,
-                cand.original_relative_path or str(cand.path),
-                cand.relative_path or str(cand.new_path),
-                cand.status,
-                cand.message.replace('"', '""'),
-            ]
-            lines.append(",".join(f'"{field}"' for field in fields))
-        Path(path).write_text("\n".join(lines))
+            candidate_indices = self.filtered_indices or range(len(self.candidates))
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle, quoting=csv.QUOTE_ALL, lineterminator="\n")
+            writer.writerow(("type", "old", "new", "status", "message"))
+            writer.writerows(
+                _display_fields(self.candidates[idx]) for idx in candidate_indices
+            )
 
     def edit_selected_target(self) -> None:
+        if self._scan_in_flight or self._apply_in_flight:
+            return
         if not self.candidates or not self.row_index_map:
             return
         rows = self.table.selectionModel().selectedRows()
         if not rows:
-            QMessageBox.information(self, "Edit Target", "Select a row to edit.")
+            self._show_message(QMessageBox.Information, "Edit Target", "Select a row to edit.")
             return
         row = rows[0].row()
         if row >= len(self.row_index_map):
-            QMessageBox.warning(self, "Edit Target", "Selected row cannot be edited.")
+            self._show_message(
+                QMessageBox.Warning, "Edit Target", "Selected row cannot be edited."
+            )
             return
         cand = self.candidates[self.row_index_map[row]]
         new_name, ok = QInputDialog.getText(
@@ -711,8 +1282,8 @@ class MainWindow(QMainWindow):
 
         # Validate the new name
         if any(sep in new_name for sep in ("/", "\\")):
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 "Invalid name",
                 "Name cannot contain path separators (/ or \\).",
             )
@@ -736,8 +1307,8 @@ class MainWindow(QMainWindow):
             return
 
         # Notify success but don't rescan - let them edit multiple files
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Rename Complete",
             f"File renamed successfully.\n\n"
             f"Note: You'll need to rescan before applying additional changes.",
@@ -745,37 +1316,31 @@ class MainWindow(QMainWindow):
 
     def apply_rename_on_disk(self, cand: "RenameCandidate", new_name: str) -> bool:
         """Actually rename a file or directory on disk."""
+        source = cand.path
         try:
-            source = cand.path
-            if not source.exists():
-                QMessageBox.warning(
-                    self,
-                    "File Not Found",
-                    f"Source file not found: {source}",
-                )
-                return False
-
-            parent = source.parent
-            target = parent / new_name
-
-            if target.exists():
-                QMessageBox.warning(
-                    self,
-                    "Target Exists",
-                    f"A file or directory with the name '{new_name}' already exists.",
-                )
-                return False
-
-            source.rename(target)
-            return True
-
+            _rename_in_place(source, new_name)
+        except FileExistsError:
+            self._show_message(
+                QMessageBox.Warning,
+                "Target Exists",
+                f"A file or directory with the name '{new_name}' already exists.",
+            )
+            return False
+        except FileNotFoundError:
+            self._show_message(
+                QMessageBox.Warning,
+                "File Not Found",
+                f"Source file not found: {source}",
+            )
+            return False
         except OSError as exc:
-            QMessageBox.critical(
-                self,
+            self._show_message(
+                QMessageBox.Critical,
                 "Rename Failed",
                 f"Failed to rename file:\n\n{exc}",
             )
             return False
+        return True
 
 
 
@@ -788,6 +1353,10 @@ class TokenManagerDialog(QDialog):
         self._config_updated = False
         self.current_preset_name: Optional[str] = None
         self.current_preset_tokens: List[str] = []
+        # Built on first use; the help HTML is laid out only once per dialog.
+        self._help_dialog: Optional[QDialog] = None
+        self._tokens: List[str] = []
+        self._tokens_revision = -1
 
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Tokens (one per line, raw text or regex allowed):"))
@@ -803,8 +1372,12 @@ class TokenManagerDialog(QDialog):
         tokens_text = "\n".join(tokens_source)
         self.token_edit = QPlainTextEdit(tokens_text)
         self.token_edit.setMinimumHeight(260)
-        self.token_edit.textChanged.connect(self.refresh_duplicate_notice)
-        self.token_edit.textChanged.connect(self.update_warning_message)
+        # Re-check duplicates/preset state once typing pauses, not per keystroke.
+        self._token_check_timer = QTimer(self)
+        self._token_check_timer.setSingleShot(True)
+        self._token_check_timer.setInterval(150)
+        self._token_check_timer.timeout.connect(self.refresh_token_state)
+        self.token_edit.textChanged.connect(self._token_check_timer.start)
         layout.addWidget(self.token_edit)
 
         action_layout = QHBoxLayout()
@@ -816,16 +1389,17 @@ class TokenManagerDialog(QDialog):
         action_layout.addStretch(1)
 
         # Determine initial preset state for warning message
-        default_preset_tokens = load_preset_tokens("default")
-        minimal_preset_tokens = load_preset_tokens("minimal")
         current_config_tokens = config.tokens if config.tokens is not None else []
-        
-        if sorted(current_config_tokens) == sorted(default_preset_tokens):
-            self.current_preset_name = "default"
-            self.current_preset_tokens = default_preset_tokens
-        elif sorted(current_config_tokens) == sorted(minimal_preset_tokens):
-            self.current_preset_name = "minimal"
-            self.current_preset_tokens = minimal_preset_tokens
+        # Sorted token list -> preset, so the config is matched with one lookup.
+        # "default" goes in last so it wins if both presets are identical.
+        presets_by_key = {}
+        for name in ("minimal", "default"):
+            preset_tokens = load_preset_tokens(name)
+            presets_by_key[tuple(sorted(preset_tokens))] = (name, preset_tokens)
+        match = presets_by_key.get(tuple(sorted(current_config_tokens)))
+
+        if match is not None:
+            self.current_preset_name, self.current_preset_tokens = match
         else:
             self.current_preset_name = None
             self.current_preset_tokens = list(current_config_tokens)
@@ -857,19 +1431,45 @@ class TokenManagerDialog(QDialog):
         layout.addWidget(buttons)
 
         self.refresh_presets()
-        self.update_warning_message()
         self.refresh_duplicate_notice()
 
     @property
     def config_updated(self) -> bool:
         return self._config_updated
 
+    @property
+    def current_preset_tokens(self) -> List[str]:
+        return self._preset_tokens
+
+    @current_preset_tokens.setter
+    def current_preset_tokens(self, tokens: List[str]) -> None:
+        # Sorted once here; the editor is compared against it on every keystroke.
+        self._preset_tokens = tokens
+        self._preset_key = sorted(tokens)
+
     def current_tokens(self) -> List[str]:
-        return [
-            line.strip()
-            for line in self.token_edit.toPlainText().splitlines()
-            if line.strip()
-        ]
+        # The duplicate and preset checks both ask on the same tick; reparse
+        # only when the document has changed since the last call.
+        revision = self.token_edit.document().revision()
+        if revision != self._tokens_revision:
+            self._tokens = [
+                stripped
+                for stripped in map(str.strip, self.token_edit.toPlainText().splitlines())
+                if stripped
+            ]
+            self._tokens_revision = revision
+        return list(self._tokens)
+
+    def set_editor_tokens(self, text: str) -> None:
+        """Replace the editor contents without queueing another token check."""
+        # Callers refresh explicitly; textChanged would just repeat that work.
+        with QSignalBlocker(self.token_edit):
+            self.token_edit.setPlainText(text)
+        self._token_check_timer.stop()
+
+    def refresh_token_state(self) -> None:
+        self.update_warning_message()
+        self.refresh_duplicate_notice()
 
     def update_warning_message(self) -> None:
         """Display a warning if a default/minimal preset is loaded and being edited."""
@@ -880,7 +1480,7 @@ class TokenManagerDialog(QDialog):
         current_tokens_in_editor = self.current_tokens()
         
         # Compare current editor tokens with the last loaded preset tokens
-        if sorted(current_tokens_in_editor) == sorted(self.current_preset_tokens):
+        if sorted(current_tokens_in_editor) == self._preset_key:
             if self.current_preset_name in ["default", "minimal"]:
                 self.warning_text.setHtml(
                     "<p>You are viewing a <b>predefined token set</b>. "
@@ -920,14 +1520,14 @@ class TokenManagerDialog(QDialog):
         if len(deduped) == len(tokens):
             QMessageBox.information(self, "Duplicates", "No duplicates to remove.")
             return
-        self.token_edit.setPlainText("\n".join(deduped))
+        self.set_editor_tokens("\n".join(deduped))
         self.apply_tokens(deduped)
         QMessageBox.information(
             self,
             "Duplicates removed",
             "Duplicate tokens removed and configuration updated.",
         )
-        self.refresh_duplicate_notice()
+        self.refresh_token_state()
 
     def save_and_close(self) -> None:
         tokens = self.current_tokens()
@@ -939,6 +1539,15 @@ class TokenManagerDialog(QDialog):
                 "Please fix the following errors:\n\n" + "\n".join(errors),
             )
             return
+        try:
+            compile_regex(build_regex(tokens))
+        except re.error as exc:
+            QMessageBox.warning(
+                self,
+                "Invalid Tokens",
+                f"The tokens do not form a valid regular expression:\n\n{exc}",
+            )
+            return
         self.apply_tokens(tokens)
         QMessageBox.information(self, "Tokens saved", "Token configuration updated.")
         self.accept()
@@ -950,8 +1559,8 @@ class TokenManagerDialog(QDialog):
         if not path:
             return
         try:
-            text = Path(path).read_text()
-            tokens = [line.strip() for line in text.splitlines() if line.strip()]
+            with open(path) as handle:
+                tokens = [stripped for stripped in map(str.strip, handle) if stripped]
             errors = validate_tokens(tokens)
             if errors:
                 QMessageBox.warning(
@@ -964,8 +1573,8 @@ class TokenManagerDialog(QDialog):
         except OSError as exc:
             QMessageBox.warning(self, "Import failed", str(exc))
             return
-        self.token_edit.setPlainText(text.strip())
-        self.refresh_duplicate_notice()
+        self.set_editor_tokens("\n".join(tokens))
+        self.refresh_token_state()
 
     def export_tokens(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -973,17 +1582,22 @@ class TokenManagerDialog(QDialog):
         )
         if not path:
             return
+        # current_tokens() is usually already parsed for this revision, so
+        # the editor buffer isn't copied out again just to be written.
+        tokens = self.current_tokens()
         try:
-            Path(path).write_text(self.token_edit.toPlainText().strip())
+            with open(path, "w") as handle:
+                handle.writelines(f"{token}\n" for token in tokens)
         except OSError as exc:
             QMessageBox.warning(self, "Export failed", str(exc))
 
     def refresh_presets(self) -> None:
         """Scan for presets and populate the dropdown."""
         self.presets = get_presets()
-        self.preset_combo.clear()
-        if self.presets:
-            self.preset_combo.addItems([p.replace("_", " ").title() for p in self.presets])
+        with QSignalBlocker(self.preset_combo):
+            self.preset_combo.clear()
+            if self.presets:
+                self.preset_combo.addItems([p.replace("_", " ").title() for p in self.presets])
         # After refreshing presets, reset current_preset_name to avoid stale state
         self.current_preset_name = None
         self.current_preset_tokens = []
@@ -1017,13 +1631,17 @@ class TokenManagerDialog(QDialog):
             if confirm != QMessageBox.Yes:
                 return
         
-        self.token_edit.setPlainText("\n".join(tokens))
+        self.set_editor_tokens("\n".join(tokens))
         self.current_preset_name = current_preset_name
         self.current_preset_tokens = tokens
-        self.update_warning_message()
-        self.refresh_duplicate_notice()
+        self.refresh_token_state()
 
     def show_help(self) -> None:
+        if self._help_dialog is None:
+            self._help_dialog = self._build_help_dialog()
+        self._help_dialog.exec()
+
+    def _build_help_dialog(self) -> QDialog:
         dialog = QDialog(self)
         dialog.setWindowTitle("Regex & Tokens Help")
         dialog.resize(640, 420)
@@ -1036,15 +1654,10 @@ class TokenManagerDialog(QDialog):
         buttons.rejected.connect(dialog.reject)
         buttons.accepted.connect(dialog.accept)
         layout.addWidget(buttons)
-        dialog.exec()
+        return dialog
 
     def apply_tokens(self, tokens: List[str]) -> None:
-        stored_tokens = list(tokens)
-        self.config.tokens = stored_tokens
-        if stored_tokens:
-            self.config.regex = build_regex(stored_tokens)
-        else:
-            self.config.regex = DEFAULT_PATTERN
+        self.config.set_tokens(tokens)
         self.config.save()
         self._config_updated = True
 
@@ -1058,42 +1671,47 @@ class ConflictResolutionDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Resolve Multi-Conflicts")
         layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("Conflicting items:"))
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        container = QWidget()
-        container_layout = QVBoxLayout(container)
-        self.editors: List[tuple[RenameCandidate, QLineEdit]] = []
-        for idx, cand in enumerate(candidates, start=1):
-            group = QGroupBox(f"Item {idx}")
-            group_layout = QVBoxLayout(group)
-            group_layout.addWidget(
-                QLabel(f"Original: {cand.original_relative_path or cand.path}")
-            )
-            edit = QLineEdit(cand.new_name)
-            group_layout.addWidget(QLabel("Target name:"))
-            group_layout.addWidget(edit)
-            container_layout.addWidget(group)
-            self.editors.append((cand, edit))
-        container_layout.addStretch(1)
-        scroll.setWidget(container)
-        layout.addWidget(scroll)
+        layout.addWidget(QLabel("Conflicting items (double-click a target name to edit):"))
+        self.candidates = list(candidates)
+        self.table = QTableWidget(len(self.candidates), 2, self)
+        self.table.setHorizontalHeaderLabels(["Original", "Target name"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setEditTriggers(
+            QAbstractItemView.DoubleClicked
+            | QAbstractItemView.EditKeyPressed
+            | QAbstractItemView.AnyKeyPressed
+        )
+        for row, cand in enumerate(self.candidates):
+            original = QTableWidgetItem(cand.original_relative_path or cand.path_str)
+            original.setFlags(original.flags() & ~Qt.ItemIsEditable)
+            self.table.setItem(row, 0, original)
+            self.table.setItem(row, 1, QTableWidgetItem(cand.new_name))
+        layout.addWidget(self.table)
         buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
     def names(self) -> List[tuple[RenameCandidate, str]]:
-        return [(cand, edit.text()) for cand, edit in self.editors]
+        # Commit an edit still in progress so Save picks up what's on screen.
+        self.table.setCurrentItem(None)
+        return [
+            (cand, self.table.item(row, 1).text())
+            for row, cand in enumerate(self.candidates)
+        ]
 
 
 def resolve_conflict(self: MainWindow) -> None:
+    if self._scan_in_flight or self._apply_in_flight:
+        return
     if not self.row_index_map:
         return
     rows = self.table.selectionModel().selectedRows()
     if not rows:
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Resolve Multi-Conflicts",
             "Select a conflicting row first.",
         )
@@ -1103,82 +1721,97 @@ def resolve_conflict(self: MainWindow) -> None:
         return
     cand = self.candidates[self.row_index_map[row]]
     if not cand.message.startswith("Multiple items"):
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Resolve Multi-Conflicts",
             "This row is not part of a multi-item conflict.",
         )
         return
-    target_norm = _normalize_path_for_gui(cand.new_path)
-    collisions = [
-        other
-        for other in self.candidates
-        if _normalize_path_for_gui(other.new_path) == target_norm
-    ]
+    target_norm = _normalize_path_for_gui(cand.new_path_str)
+    collisions = list(self._candidates_by_target().get(target_norm, ()))
     if len(collisions) < 2:
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Resolve Multi-Conflicts",
             "Could not locate multiple conflicting items for this entry.",
         )
         return
     dialog = ConflictResolutionDialog(collisions, self)
-    if dialog.exec() == QDialog.Accepted:
-        # Confirm the rename operation
-        confirm = QMessageBox.question(
-            self,
-            "Confirm Rename",
-            f"This will immediately rename {len(collisions)} conflicting items.\n\n"
-            f"Continue?",
-            QMessageBox.Yes | QMessageBox.No,
-        )
-        if confirm != QMessageBox.Yes:
-            return
-
-        # Validate and rename each file
-        success_count = 0
-        failed = []
-
-        for candidate, new_name in dialog.names():
-            new_name = new_name.strip()
-
-            # Validate the new name
-            if not new_name:
-                failed.append(f"{candidate.path.name}: Name cannot be empty")
-                continue
+    if dialog.exec() != QDialog.Accepted:
+        return
 
-            if any(sep in new_name for sep in ("/", "\\")):
-                failed.append(f"{candidate.path.name}: Name cannot contain path separators")
-                continue
+    # Check every name before touching the disk, so a bad entry can't leave
+    # the group half renamed.
+    plan: List[Tuple[RenameCandidate, str]] = []
+    invalid: List[str] = []
+    planned_targets = set()
+    for candidate, new_name in dialog.names():
+        new_name = new_name.strip()
+        if not new_name:
+            invalid.append(f"{candidate.path.name}: Name cannot be empty")
+            continue
+        if any(sep in new_name for sep in ("/", "\\")):
+            invalid.append(f"{candidate.path.name}: Name cannot contain path separators")
+            continue
+        planned_norm = _normalize_path_for_gui(os.path.join(candidate.path.parent, new_name))
+        if planned_norm in planned_targets:
+            invalid.append(f"{candidate.path.name}: '{new_name}' is used for another item")
+            continue
+        planned_targets.add(planned_norm)
+        plan.append((candidate, new_name))
+    if invalid:
+        self._show_message(
+            QMessageBox.Warning,
+            "Conflicts Not Resolved",
+            "No items were renamed. Fix these names and try again:\n\n" + "\n".join(invalid),
+        )
+        return
 
-            # Actually rename the file
-            if self.apply_rename_on_disk(candidate, new_name):
-                success_count += 1
-            else:
-                failed.append(f"{candidate.path.name}: Rename failed")
+    confirm = QMessageBox.question(
+        self,
+        "Confirm Rename",
+        f"This will immediately rename {len(plan)} conflicting items.\n\n"
+        f"Continue?",
+        QMessageBox.Yes | QMessageBox.No,
+    )
+    if confirm != QMessageBox.Yes:
+        return
 
-        # Show results
-        if failed:
-            QMessageBox.warning(
-                self,
-                "Conflicts Partially Resolved",
-                f"Successfully renamed {success_count} items.\n\n"
-                f"Failed:\n" + "\n".join(failed) +
-                f"\n\nNote: You'll need to rescan before applying additional changes.",
-            )
+    success_count = 0
+    failed = []
+    for candidate, new_name in plan:
+        try:
+            _rename_in_place(candidate.path, new_name)
+        except FileExistsError:
+            failed.append(f"{candidate.path.name}: '{new_name}' already exists")
+        except OSError as exc:
+            failed.append(f"{candidate.path.name}: {exc.strerror or exc}")
         else:
-            QMessageBox.information(
-                self,
-                "Conflicts Resolved",
-                f"Successfully renamed all {success_count} items.\n\n"
-                f"Note: You'll need to rescan before applying additional changes.",
-            )
-
+            success_count += 1
+
+    if failed:
+        self._show_message(
+            QMessageBox.Warning,
+            "Conflicts Partially Resolved",
+            f"Successfully renamed {success_count} items.\n\n"
+            f"Failed:\n" + "\n".join(failed) +
+            f"\n\nNote: You'll need to rescan before applying additional changes.",
+        )
+    else:
+        self._show_message(
+            QMessageBox.Information,
+            "Conflicts Resolved",
+            f"Successfully renamed all {success_count} items.\n\n"
+            f"Note: You'll need to rescan before applying additional changes.",
+        )
 
 MainWindow.resolve_conflict = resolve_conflict
 
 def main() -> None:
     app = QApplication(sys.argv)
+    # Let Ctrl+C in the launching terminal close the app; Qt's event loop
+    # would otherwise swallow SIGINT until the next Python callback runs.
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
     try:
         window = MainWindow()
     except ConfigLoadError as exc:
@@ -2,30 +2,88 @@
 
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass, asdict, field
+import os
+import re
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 PRESETS_DIR = Path(__file__).parent / "presets"
 
 
+@functools.lru_cache(maxsize=8)
+def _read_preset(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Parse a preset file; cached until its mtime or size changes."""
+    return tuple(
+        line.strip() for line in Path(path).read_text().splitlines() if line.strip()
+    )
+
+
 def load_preset_tokens(preset_name: str) -> List[str]:
     """Load a list of tokens from a preset file."""
     preset_file = PRESETS_DIR / f"{preset_name}.txt"
-    if not preset_file.exists():
+    try:
+        stat = preset_file.stat()
+    except FileNotFoundError:
         return []
-    return [
-        line.strip() for line in preset_file.read_text().splitlines() if line.strip()
-    ]
+    return list(_read_preset(str(preset_file), stat.st_mtime_ns, stat.st_size))
+
+
+# Tokens containing any of these are treated as regex; the rest are plain text.
+REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _trie_alternation(node: dict) -> str:
+    """Render a prefix trie of plain-text tokens as a regex alternation."""
+    branches = [char + _trie_alternation(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    body = "|".join(branches)
+    if "" in node:
+        return f"(?:{body})?"
+    return f"(?:{body})" if len(branches) > 1 else body
 
 
 def build_regex(tokens: List[str]) -> str:
-    """Build the regex pattern from a list of tokens."""
-    inner = "|".join(filter(None, tokens))
+    """Build the regex pattern from a list of tokens.
+
+    Repeated tokens are dropped (first occurrence kept) so they don't add
+    redundant branches to the alternation. Consecutive plain-text tokens
+    that share a prefix are merged (``En,(?:De|Fr)`` rather than
+    ``En,De|En,Fr``) so the regex engine compares the prefix once. Regex
+    tokens keep their place between those runs, so which alternative wins
+    still follows the token order.
+    """
+    branches: List[str] = []
+    run: dict = {}
+    for token in dict.fromkeys(filter(None, tokens)):
+        if REGEX_METACHARS.intersection(token):
+            # A plain token has no ')' and so can only match one way; only
+            # its position relative to regex tokens matters.
+            branches.extend(char + _trie_alternation(child) for char, child in run.items())
+            run = {}
+            branches.append(token)
+            continue
+        node = run
+        for char in token:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    branches.extend(char + _trie_alternation(child) for char, child in run.items())
+    inner = "|".join(branches)
     return rf"\s*\((?:{inner})\)\s*"
 
 
+@functools.lru_cache(maxsize=16)
+def compile_regex(text: str) -> re.Pattern[str]:
+    """Compile a region regex, caching the result by pattern text.
+
+    Raises ``re.error`` when the pattern is invalid.
+    """
+    return re.compile(text)
+
+
 DEFAULT_TOKENS = load_preset_tokens("default")
 DEFAULT_PATTERN = build_regex(DEFAULT_TOKENS)
 
@@ -40,6 +98,12 @@ class ConfigLoadError(RuntimeError):
         super().__init__(message)
 
 
+@functools.lru_cache(maxsize=4)
+def _read_config_data(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a config file; cached until its mtime or size changes."""
+    return json.loads(Path(path).read_text())
+
+
 @dataclass
 class AppConfig:
     regex: str = DEFAULT_PATTERN
@@ -47,10 +111,24 @@ class AppConfig:
     rename_root: bool = True
     stop_on_error: bool = False
     auto_resolve_conflicts: bool = False
+    parallel_scan: bool = False
     tokens: Optional[List[str]] = field(
         default_factory=lambda: DEFAULT_TOKENS.copy()
     )
 
+    @property
+    def pattern(self) -> re.Pattern[str]:
+        """The compiled ``regex``; recompiled only when the text changes."""
+        return compile_regex(self.regex)
+
+    def set_tokens(self, tokens: List[str]) -> None:
+        """Replace the token list and rebuild ``regex`` from it.
+
+        An empty list falls back to the default pattern.
+        """
+        self.tokens = list(tokens)
+        self.regex = build_regex(self.tokens) if self.tokens else DEFAULT_PATTERN
+
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "AppConfig":
         is_default_path = path is None
@@ -65,7 +143,8 @@ class AppConfig:
                 raise FileNotFoundError(f"Config file not found at specified path: {path}")
 
         try:
-            data = json.loads(path.read_text())
+            stat = path.stat()
+            data = _read_config_data(str(path), stat.st_mtime_ns, stat.st_size)
         except json.JSONDecodeError as exc:  # pragma: no cover - depends on user input
             raise ConfigLoadError(path, f"Failed to parse config: {exc}") from exc
         except OSError as exc:  # pragma: no cover - depends on filesystem issues
@@ -85,6 +164,7 @@ class AppConfig:
             rename_root=data.get("rename_root", True),
             stop_on_error=data.get("stop_on_error", False),
             auto_resolve_conflicts=data.get("auto_resolve_conflicts", False),
+            parallel_scan=data.get("parallel_scan", False),
             tokens=tokens,
         )
         if config.tokens:
@@ -95,14 +175,29 @@ class AppConfig:
     def save(self, path: Optional[Path] = None) -> None:
         path = path or CONFIG_PATH
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(asdict(self), indent=2))
+        # Shallow field dict: asdict() would deep-copy the token list first.
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        # Write beside the target and swap it in, so a crash mid-write never
+        # leaves a truncated config behind.
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as handle:
+                json.dump(data, handle, indent=2)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        # A rewrite can land within the same mtime tick at the same size.
+        _read_config_data.cache_clear()
 
 
 __all__ = [
     "AppConfig",
     "DEFAULT_PATTERN",
     "DEFAULT_TOKENS",
+    "REGEX_METACHARS",
     "build_regex",
+    "compile_regex",
     "CONFIG_PATH",
     "ConfigLoadError",
 ]
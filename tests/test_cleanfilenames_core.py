@@ -1,14 +1,19 @@
 """Tests for cleanfilenames_core module."""
 
+import os
 import re
+import threading
 from pathlib import Path
 
 import pytest
 
 from cleanfilenames_core import (
     RenameCandidate,
+    Status,
+    _pattern_for_tokens,
     apply_candidates,
     collect_candidates,
+    iter_candidates,
     normalize_name,
     summarize,
 )
@@ -59,6 +64,29 @@ class TestNormalizeName:
         pattern = re.compile(r"\s*\(v\d+\.\d+\)\s*")
         assert normalize_name("Game (v1.0).zip", pattern) == "Game.zip"
 
+    def test_token_classes_match_unicode(self):
+        """Test that regex tokens keep re's Unicode-aware classes."""
+        pattern = _pattern_for_tokens(("USA", r"v\d+"))
+        assert normalize_name("Game (v\u0661).zip", pattern) == "Game.zip"
+
+    def test_tidies_names_without_tags(self):
+        """Test that names without parentheses still get whitespace tidied."""
+        assert normalize_name("Game .zip") == "Game.zip"
+        assert normalize_name(" Game  Name.zip ") == "Game Name.zip"
+
+    def test_custom_pattern_without_parentheses(self):
+        """Test patterns that don't require '(' are still applied."""
+        pattern = re.compile(r"\s*\[USA\]\s*")
+        assert normalize_name("Game [USA].zip", pattern) == "Game.zip"
+
+    def test_results_depend_on_pattern(self):
+        """Test that cached results are not shared between patterns."""
+        usa = re.compile(r"\s*\((?:USA)\)\s*")
+        eu = re.compile(r"\s*\((?:EU)\)\s*")
+        assert normalize_name("Game (USA).zip", usa) == "Game.zip"
+        assert normalize_name("Game (USA).zip", eu) == "Game (USA).zip"
+        assert normalize_name("Game (USA).zip", usa) == "Game.zip"
+
 
 class TestCollectCandidates:
     """Tests for collect_candidates function."""
@@ -104,11 +132,71 @@ class TestCollectCandidates:
         root_candidates = [c for c in candidates if c.path == root]
         assert len(root_candidates) == 0
 
+    def test_uses_config_regex_without_tokens(self, temp_dir):
+        """Test that a config with no tokens scans with its own regex."""
+        (temp_dir / "Game [USA].zip").touch()
+        (temp_dir / "Game (USA).zip").touch()
+
+        config = AppConfig(regex=r"\s*\[USA\]\s*", tokens=[])
+        candidates = collect_candidates(temp_dir, config=config)
+
+        assert [c.new_name for c in candidates] == ["Game.zip"]
+        assert candidates[0].path.name == "Game [USA].zip"
+
     def test_nonexistent_path_raises_error(self):
         """Test that nonexistent path raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             collect_candidates("/nonexistent/path")
 
+    def test_parallel_scan_matches_sequential(self, sample_dirs):
+        """Test that parallel_scan yields the same candidates in the same order."""
+        config = AppConfig()
+        sequential = collect_candidates(sample_dirs, config=config)
+        config.parallel_scan = True
+        parallel = collect_candidates(sample_dirs, config=config)
+        assert [(c.path, c.new_path) for c in parallel] == [
+            (c.path, c.new_path) for c in sequential
+        ]
+
+    def test_iter_candidates_matches_collect(self, sample_dirs):
+        """Test that streamed candidates match the collected list."""
+        config = AppConfig()
+        streamed = list(iter_candidates(sample_dirs, config=config))
+        collected = collect_candidates(sample_dirs, config=config)
+        assert [(c.path, c.new_path, c.relative_path) for c in streamed] == [
+            (c.path, c.new_path, c.relative_path) for c in collected
+        ]
+
+    def test_iter_candidates_checks_path_eagerly(self):
+        """Test that a missing root is reported before iteration starts."""
+        with pytest.raises(FileNotFoundError):
+            iter_candidates("/nonexistent/path")
+
+    def test_iter_candidates_stops_when_cancelled(self, sample_dirs):
+        """Test that a set cancel event ends the scan without results."""
+        cancel = threading.Event()
+        cancel.set()
+        assert list(iter_candidates(sample_dirs, config=AppConfig(), cancel=cancel)) == []
+
+    def test_iter_candidates_reports_progress(self, temp_dir):
+        """Test that the progress callback sees a growing entry count."""
+        for i in range(1500):
+            (temp_dir / f"Game {i} (USA).zip").touch()
+        seen = []
+        candidates = list(
+            iter_candidates(temp_dir, config=AppConfig(), progress=seen.append)
+        )
+        assert len(candidates) == 1500
+        assert seen == [1500]
+
+    def test_path_strings_match_paths(self, sample_dirs):
+        """Test that the cached path strings agree with the Path fields."""
+        candidates = collect_candidates(sample_dirs, config=AppConfig())
+        assert candidates
+        for cand in candidates:
+            assert cand.path_str == str(cand.path)
+            assert cand.new_path_str == str(cand.new_path)
+
     def test_nested_directory_order(self, sample_dirs):
         """Test that directories are ordered deepest-first."""
         config = AppConfig()
@@ -146,6 +234,30 @@ class TestApplyCandidates:
 
         assert all(c.status == "done (dry run)" for c in candidates)
 
+    def test_status_values_are_strings(self, sample_files):
+        """Test that Status members behave like their string values."""
+        config = AppConfig()
+        config.auto_resolve_conflicts = True
+        candidates = collect_candidates(sample_files, config=config)
+        apply_candidates(candidates, config=config, dry_run=True)
+        assert all(c.status is Status.DRY_RUN for c in candidates)
+        assert f"{Status.DRY_RUN}" == str(Status.DRY_RUN) == "done (dry run)"
+        assert candidates[0].to_dict()["status"] == "done (dry run)"
+
+    def test_progress_reports_each_candidate(self, collision_files):
+        """Test that progress sees every candidate after its status is set."""
+        config = AppConfig()
+        candidates = collect_candidates(collision_files, config=config)
+        seen = []
+        apply_candidates(
+            candidates,
+            config=config,
+            dry_run=True,
+            progress=lambda cand: seen.append((cand, cand.status)),
+        )
+        assert sorted(id(c) for c, _ in seen) == sorted(id(c) for c in candidates)
+        assert all(status == c.status != "pending" for c, status in seen)
+
     def test_actual_rename(self, temp_dir):
         """Test that files are actually renamed."""
         test_file = temp_dir / "Game (USA).zip"
@@ -203,6 +315,24 @@ class TestApplyCandidates:
         errors = [c for c in candidates if c.status == "error"]
         assert len(errors) == 0
 
+    def test_renamed_root_with_untagged_intermediate_directory(self, temp_dir):
+        """Test files below an untagged directory inside a renamed root."""
+        root = temp_dir / "Roms (USA)"
+        inner = root / "Extras" / "Music (EU)"
+        inner.mkdir(parents=True)
+        (inner / "Track (JP).mp3").touch()
+
+        config = AppConfig()
+        candidates = collect_candidates(root, config=config)
+        music = next(c for c in candidates if c.new_name == "Music")
+        assert music.new_path == temp_dir / "Roms" / "Extras" / "Music"
+        assert music.relative_path == os.path.join("Extras", "Music")
+
+        apply_candidates(candidates, config=config, dry_run=False)
+
+        assert all(c.status == "done" for c in candidates)
+        assert (temp_dir / "Roms" / "Extras" / "Music" / "Track.mp3").exists()
+
 
 class TestSummarize:
     """Tests for summarize function."""
@@ -244,3 +374,8 @@ class TestSummarize:
         summary = summarize(candidates)
 
         assert summary["errors"] > 0
+        assert len(summary["error_details"]) == summary["errors"]
+        failed = next(c for c in candidates if c.status == "error")
+        assert summary["error_details"][0] == (
+            f"{failed.path} -> {failed.new_path}: {failed.message}"
+        )
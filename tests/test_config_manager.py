@@ -1,6 +1,7 @@
 """Tests for config_manager module."""
 
 import json
+import re
 from pathlib import Path
 
 import pytest
@@ -42,6 +43,49 @@ class TestBuildRegex:
         pattern = build_regex(tokens)
         assert pattern == r"\s*\((?:USA|EU)\)\s*"
 
+    def test_drops_repeated_tokens(self):
+        """Test that repeated tokens appear once, in first-seen order."""
+        tokens = ["USA", "EU", "USA", "JP", "EU"]
+        pattern = build_regex(tokens)
+        assert pattern == r"\s*\((?:USA|EU|JP)\)\s*"
+
+    def test_merges_shared_prefixes(self):
+        """Test that plain tokens sharing a prefix become one branch."""
+        tokens = ["En,Fr", "En,De", "USA", "USA,Asia"]
+        pattern = build_regex(tokens)
+        assert pattern == r"\s*\((?:En,(?:Fr|De)|USA(?:,Asia)?)\)\s*"
+
+    def test_merged_pattern_matches_each_token(self):
+        """Test that every token still matches on its own, and nothing more."""
+        tokens = ["U", "USA", "USA,Asia", "En,Fr", r"v\d+"]
+        regex = re.compile(build_regex(tokens))
+        for name in ("(U)", "(USA)", "(USA,Asia)", "(En,Fr)", "(v2)"):
+            assert regex.fullmatch(name)
+        for name in ("(US)", "(USA,)", "(En)", "(v)"):
+            assert not regex.fullmatch(name)
+
+
+    def test_regex_tokens_keep_their_position(self):
+        """Test that merging plain tokens doesn't reorder them past regex tokens."""
+        overlapping = r"USA\) \(EU"
+        assert build_regex(["USA", overlapping]) == r"\s*\((?:USA|USA\) \(EU)\)\s*"
+        pattern = re.compile(build_regex([overlapping, "USA"]))
+        assert pattern.sub(" ", "Game (USA) (EU).zip") == "Game .zip"
+
+    def test_default_preset_cleans_like_flat_alternation(self):
+        """Test that the merged default pattern strips exactly what the plain one did."""
+        flat_inner = "|".join(dict.fromkeys(filter(None, DEFAULT_TOKENS)))
+        flat = re.compile(rf"\s*\((?:{flat_inner})\)\s*")
+        merged = re.compile(build_regex(DEFAULT_TOKENS))
+        names = [f"Game ({token}) (Beta).zip" for token in DEFAULT_TOKENS]
+        names += [
+            "Game (USA) (En,Fr,De) (v1.02).zip",
+            "Game (USA, Europe)(Rev 1).zip",
+            "Game (En,Fr,De,Es,It,X) (US).zip",
+        ]
+        for name in names:
+            assert merged.sub(" ", name) == flat.sub(" ", name)
+
 
 class TestLoadPresetTokens:
     """Tests for load_preset_tokens function."""
@@ -63,6 +107,12 @@ class TestLoadPresetTokens:
         tokens = load_preset_tokens("nonexistent")
         assert tokens == []
 
+    def test_returns_independent_lists(self):
+        """Test that callers can modify the returned list safely."""
+        tokens = load_preset_tokens("minimal")
+        tokens.append("Changed")
+        assert "Changed" not in load_preset_tokens("minimal")
+
 
 class TestAppConfig:
     """Tests for AppConfig class."""
@@ -77,6 +127,32 @@ class TestAppConfig:
         assert config.auto_resolve_conflicts is False
         assert config.tokens == DEFAULT_TOKENS
 
+    def test_pattern_follows_regex(self):
+        """Test that the compiled pattern tracks changes to regex."""
+        config = AppConfig(regex=build_regex(["USA"]))
+        assert config.pattern is config.pattern
+        assert config.pattern.search("Game (USA).zip")
+        config.regex = build_regex(["EU"])
+        assert not config.pattern.search("Game (USA).zip")
+        assert config.pattern.search("Game (EU).zip")
+
+    def test_set_tokens_rebuilds_regex(self):
+        """Test that set_tokens copies the tokens and rebuilds the regex."""
+        tokens = ["USA", "EU"]
+        config = AppConfig()
+        config.set_tokens(tokens)
+        tokens.append("JP")
+        assert config.tokens == ["USA", "EU"]
+        assert config.regex == build_regex(["USA", "EU"])
+        assert config.pattern.search("Game (EU).zip")
+
+    def test_set_tokens_empty_uses_default_pattern(self):
+        """Test that clearing the tokens falls back to the default pattern."""
+        config = AppConfig(regex=build_regex(["USA"]))
+        config.set_tokens([])
+        assert config.tokens == []
+        assert config.regex == DEFAULT_PATTERN
+
     def test_save_and_load(self, temp_dir):
         """Test saving and loading config."""
         config_path = temp_dir / "config.json"
@@ -88,6 +164,27 @@ class TestAppConfig:
         loaded = AppConfig.load(config_path)
         assert loaded.rename_directories is False
 
+    def test_save_replaces_existing_file(self, temp_dir):
+        """Test that saving over a config leaves no temporary file behind."""
+        config_path = temp_dir / "config.json"
+        config_path.write_text("{}")
+
+        AppConfig(tokens=["USA"]).save(config_path)
+
+        assert json.loads(config_path.read_text())["tokens"] == ["USA"]
+        assert [p.name for p in temp_dir.iterdir()] == ["config.json"]
+
+    def test_failed_save_keeps_existing_file(self, temp_dir):
+        """Test that a save that fails mid-write leaves the old config alone."""
+        config_path = temp_dir / "config.json"
+        config_path.write_text('{"tokens": ["USA"]}')
+
+        with pytest.raises(TypeError):
+            AppConfig(tokens=["EU", object()]).save(config_path)
+
+        assert json.loads(config_path.read_text()) == {"tokens": ["USA"]}
+        assert [p.name for p in temp_dir.iterdir()] == ["config.json"]
+
     def test_load_creates_default_if_missing(self):
         """Test that loading creates default config if file doesn't exist."""
         # When no path is specified, it should create default at default location
@@ -132,6 +229,18 @@ class TestAppConfig:
         loaded = AppConfig.load(config_path)
         assert loaded.tokens == custom_tokens
 
+    def test_repeated_loads_are_independent(self, temp_dir):
+        """Test that cached loads still return separate, up-to-date configs."""
+        config_path = temp_dir / "config.json"
+        AppConfig(tokens=["USA"]).save(config_path)
+
+        first = AppConfig.load(config_path)
+        first.tokens.append("EU")
+        assert AppConfig.load(config_path).tokens == ["USA"]
+
+        config_path.write_text(json.dumps({"tokens": ["JP", "PAL"]}))
+        assert AppConfig.load(config_path).tokens == ["JP", "PAL"]
+
     def test_load_rebuilds_regex_from_tokens(self, temp_dir):
         """Test that regex is rebuilt from tokens on load."""
         config_path = temp_dir / "config.json"
@@ -171,3 +280,15 @@ class TestAppConfig:
 
         loaded = AppConfig.load(config_path)
         assert loaded.auto_resolve_conflicts is True
+
+    def test_parallel_scan_setting(self, temp_dir):
+        """Test parallel_scan defaults off and persists."""
+        config_path = temp_dir / "config.json"
+
+        config = AppConfig()
+        assert config.parallel_scan is False
+        config.parallel_scan = True
+        config.save(config_path)
+
+        loaded = AppConfig.load(config_path)
+        assert loaded.parallel_scan is True
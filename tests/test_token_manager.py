@@ -9,6 +9,7 @@ from token_manager import (
     TokenTracker,
     find_duplicate_tokens,
     normalize_token,
+    normalized_token_set,
     validate_tokens,
 )
 
@@ -33,6 +34,18 @@ class TestNormalizeToken:
         assert normalize_token("   ") == ""
 
 
+class TestNormalizedTokenSet:
+    """Tests for normalized_token_set function."""
+
+    def test_normalizes_and_dedupes(self):
+        """Test that tokens are stripped and collapsed into a set."""
+        assert normalized_token_set([" USA", "USA ", "EU"]) == {"USA", "EU"}
+
+    def test_drops_blank_tokens(self):
+        """Test that empty and whitespace-only tokens are left out."""
+        assert normalized_token_set(["", "   ", "JP"]) == {"JP"}
+
+
 class TestFindDuplicateTokens:
     """Tests for find_duplicate_tokens function."""
 
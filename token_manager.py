@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 TOKEN_FINDER = re.compile(r"\(([^()]+)\)")
 MAX_SAMPLES = 3
@@ -37,23 +38,21 @@ def validate_tokens(tokens: List[str]) -> List[str]:
     return errors
 
 
-TOKEN_FINDER = re.compile(r"\(([^()]+)\)")
-MAX_SAMPLES = 3
-
-
 def normalize_token(token: str) -> str:
     """Trim whitespace from tokens for consistent comparisons."""
     return token.strip()
 
 
+def normalized_token_set(tokens: Iterable[str]) -> Set[str]:
+    """Return the distinct non-empty normalized forms of ``tokens``."""
+    normalized = set(map(normalize_token, tokens))
+    normalized.discard("")
+    return normalized
+
+
 def find_duplicate_tokens(tokens: Iterable[str]) -> Dict[str, int]:
     """Return a mapping of duplicate tokens to their occurrence count."""
-    counts: Dict[str, int] = {}
-    for token in tokens:
-        normalized = normalize_token(token)
-        if not normalized:
-            continue
-        counts[normalized] = counts.get(normalized, 0) + 1
+    counts = Counter(filter(None, map(normalize_token, tokens)))
     return {token: count for token, count in counts.items() if count > 1}
 
 
@@ -85,7 +84,7 @@ class TokenTracker:
         self._suggestions: Dict[str, TokenSuggestion] = {}
         self._duplicate_map = find_duplicate_tokens(known_list)
 
-    def observe(self, name: str, path: Path) -> None:
+    def observe(self, name: str, path: Union[Path, str]) -> None:
         """Record tokens spotted in a file or directory name."""
         if not name:
             return
@@ -128,5 +127,6 @@ __all__ = [
     "TokenUsage",
     "find_duplicate_tokens",
     "normalize_token",
+    "normalized_token_set",
     "validate_tokens",
 ]